@@ -1,5 +1,39 @@
-from src.core.engine import Engine
+import argparse
+from src.utils import GameSettings
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Monster Go")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window or audio, as fast as possible")
+    parser.add_argument("--ticks", type=int, default=600,
+                        help="simulation ticks to run in headless mode")
+    # battle_scene and capture_scene are entered from the game scene, which
+    # hands them the game manager and opponent first
+    parser.add_argument("--scene", default="menu", choices=("menu", "game", "settings"),
+                        help="scene to start in")
+    parser.add_argument("--input",
+                        help="input script to replay in headless mode")
+    parser.add_argument("--record-input",
+                        help="save this session's input as a script for --input")
+    parser.add_argument("--no-render", action="store_true",
+                        help="headless mode: simulate only, skip drawing")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    engine = Engine()
-    engine.run()
+    args = parse_args()
+    GameSettings.HEADLESS = args.headless
+    GameSettings.INPUT_RECORD_PATH = args.record_input
+
+    # The managers read the settings above when the engine is imported
+    from src.core.engine import Engine
+    from src.core.managers import InputScript
+
+    engine = Engine(start_scene=args.scene)
+    if args.headless:
+        script = InputScript.load(args.input) if args.input else None
+        engine.run_headless(args.ticks, script, render=not args.no_render)
+        engine.shutdown()
+    else:
+        engine.run()
@@ -2,64 +2,74 @@ from server.playerHandler import PlayerHandler
 
 from http.server import BaseHTTPRequestHandler, HTTPServer
 import json
+import socket
+import threading
 PORT = 8989
+UNIX_SOCKET_PATH = "/tmp/monster-go.sock"   # clients use "unix:///tmp/monster-go.sock"
 
 PLAYER_HANDLER = PlayerHandler()
 PLAYER_HANDLER.start()
+
+
+# Routes shared by the HTTP and the unix socket front-ends
+def handle_get(path: str) -> tuple[int, object]:
+    if path == "/":
+        return 200, {"status": "ok"}
+
+    if path == "/register":
+        pid = PLAYER_HANDLER.register()
+        return 200, {"message": "registration successful", "id": pid}
+
+    if path == "/players":
+        return 200, {"players": PLAYER_HANDLER.list_players()}
+
+    return 404, {"error": "not_found"}
+
+def handle_post(path: str, body: bytes) -> tuple[int, object]:
+    if path != "/players":
+        return 404, {"error": "not_found"}
+
+    try:
+        data = json.loads(body.decode("utf-8"))
+    except Exception:
+        return 400, {"error": "invalid_json"}
+
+    missing = [k for k in ("id", "x", "y", "map") if k not in data]
+    if missing:
+        return 400, {"error": "bad_fields", "missing": missing}
+
+    try:
+        pid = int(data["id"])
+        x = float(data["x"])
+        y = float(data["y"])
+        map_name = str(data["map"])
+    except (ValueError, TypeError):
+        return 400, {"error": "bad_fields"}
+
+    ok = PLAYER_HANDLER.update(pid, x, y, map_name)
+    if not ok:
+        return 404, {"error": "player_not_found"}
+
+    return 200, {"success": True}
+
+def handle_request(method: str, path: str, body: bytes) -> tuple[int, object]:
+    if method == "GET":
+        return handle_get(path)
+    if method == "POST":
+        return handle_post(path, body)
+    return 405, {"error": "method_not_allowed"}
     
 class Handler(BaseHTTPRequestHandler):
     # def log_message(self, fmt, *args):
     #     return
 
     def do_GET(self):
-        if self.path == "/":
-            self._json(200, {"status": "ok"})
-            return
-            
-        if self.path == "/register":
-            pid = PLAYER_HANDLER.register()
-            self._json(200, {"message": "registration successful", "id": pid})
-            return
-
-        if self.path == "/players":
-            self._json(200, {"players": PLAYER_HANDLER.list_players()})
-            return
-
-        self._json(404, {"error": "not_found"})
+        self._json(*handle_get(self.path))
 
     def do_POST(self):
-        if self.path != "/players":
-            self._json(404, {"error": "not_found"})
-            return
-
         length = int(self.headers.get("Content-Length", "0"))
-        try:
-            body = self.rfile.read(length)
-            data = json.loads(body.decode("utf-8"))
-        except Exception:
-            self._json(400, {"error": "invalid_json"})
-            return
-
-        missing = [k for k in ("id", "x", "y", "map") if k not in data]
-        if missing:
-            self._json(400, {"error": "bad_fields", "missing": missing})
-            return
-
-        try:
-            pid = int(data["id"])
-            x = float(data["x"])
-            y = float(data["y"])
-            map_name = str(data["map"])
-        except (ValueError, TypeError):
-            self._json(400, {"error": "bad_fields"})
-            return
-
-        ok = PLAYER_HANDLER.update(pid, x, y, map_name)
-        if not ok:
-            self._json(404, {"error": "player_not_found"})
-            return
-
-        self._json(200, {"success": True})
+        body = self.rfile.read(length)
+        self._json(*handle_post(self.path, body))
 
     # Utility for JSON responses
     def _json(self, code: int, obj: object) -> None:
@@ -71,5 +81,11 @@ class Handler(BaseHTTPRequestHandler):
         self.wfile.write(data)
 
 if __name__ == "__main__":
+    if hasattr(socket, "AF_UNIX"):
+        # socketserver.UnixStreamServer only exists where AF_UNIX does
+        from server.ipcServer import IPCServer
+        ipc = IPCServer(UNIX_SOCKET_PATH, handle_request)
+        threading.Thread(target=ipc.serve_forever, name="IPCServer", daemon=True).start()
+        print(f"[Server] Listening on unix socket {UNIX_SOCKET_PATH}")
     print(f"[Server] Running on localhost with port {PORT}")
     HTTPServer(("0.0.0.0", PORT), Handler).serve_forever()
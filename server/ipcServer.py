@@ -0,0 +1,64 @@
+r"""
+Unix domain socket front-end for clients on the same machine.
+
+Every message is a frame: 4-byte big-endian length followed by the payload.
+    request payload : b"<METHOD> <path>\n" + body
+    response payload: 2-byte big-endian status + JSON body
+Connections are kept open, so a client pays one syscall pair per request
+instead of a TCP handshake plus HTTP header parsing.
+"""
+import json
+import os
+import socketserver
+import struct
+from typing import Callable
+
+FRAME_HEADER = struct.Struct(">I")
+STATUS_HEADER = struct.Struct(">H")
+MAX_FRAME = 16 * 1024 * 1024
+
+RequestHandler = Callable[[str, str, bytes], tuple[int, object]]
+
+
+def read_frame(rfile) -> bytes | None:
+    header = rfile.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME:
+        return None
+    payload = rfile.read(length)
+    if len(payload) < length:
+        return None
+    return payload
+
+
+class IPCServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, handle: RequestHandler):
+        if os.path.exists(path):
+            os.remove(path)
+        self.handle_request_fn = handle
+        super().__init__(path, _IPCHandler)
+
+
+class _IPCHandler(socketserver.StreamRequestHandler):
+    server: IPCServer
+
+    def handle(self) -> None:
+        while True:
+            payload = read_frame(self.rfile)
+            if payload is None:
+                return
+
+            head, _, body = payload.partition(b"\n")
+            try:
+                method, path = head.decode("utf-8").split(" ", 1)
+                code, obj = self.server.handle_request_fn(method, path, body)
+            except ValueError:
+                code, obj = 400, {"error": "bad_frame"}
+
+            data = STATUS_HEADER.pack(code) + json.dumps(obj).encode("utf-8")
+            self.wfile.write(FRAME_HEADER.pack(len(data)) + data)
+            self.wfile.flush()
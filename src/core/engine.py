@@ -1,7 +1,11 @@
+import os
+import time
 import pygame as pg
 
 from src.utils import GameSettings, Logger
-from .services import scene_manager, input_manager
+from .services import scene_manager, input_manager, quality_manager
+from .managers import InputScript, InputRecorder
+from .render_backend import RenderBackend, create_backend
 
 from src.scenes.menu_scene import MenuScene
 from src.scenes.game_scene import GameScene
@@ -12,19 +16,34 @@ from src.scenes.capture_scene import CaptureScene
 
 class Engine:
 
-    screen: pg.Surface              # Screen Display of the Game
+    backend: RenderBackend          # Presents frames (software surface, _sdl2 textures or threaded)
     clock: pg.time.Clock            # Clock for FPS control
     running: bool                   # Running state of the game
+    full_redraw: bool               # Next frame must redraw the whole screen
+    minimized: bool                 # Window is minimized, nothing to render
+    focused: bool                   # Window has keyboard focus
+    tick: int                       # Simulation ticks run so far
+    input_recorder: InputRecorder | None
 
-    def __init__(self):
+    def __init__(self, start_scene: str = "menu"):
         Logger.info("Initializing Engine")
 
+        if GameSettings.HEADLESS:
+            # SDL's dummy drivers: surfaces still work, nothing is shown or played
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pg.init()
 
-        self.screen = pg.display.set_mode(
+        self.backend = create_backend(
             (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
         self.clock = pg.time.Clock()
         self.running = True
+        self.full_redraw = True
+        self.minimized = False
+        self.focused = True
+        self.tick = 0
+        self.input_recorder = (InputRecorder(GameSettings.INPUT_RECORD_PATH)
+                               if GameSettings.INPUT_RECORD_PATH else None)
 
         pg.display.set_caption(GameSettings.TITLE)
 
@@ -37,28 +56,123 @@ class Engine:
         [TODO HACKATHON 5]
         Register the setting scene here
         '''
-        scene_manager.change_scene("menu")
+        scene_manager.change_scene(start_scene)
 
     def run(self):
         Logger.info("Running the Game Loop ...")
 
+        # The simulation always advances in fixed steps of 1 / SIM_RATE;
+        # rendering runs at its own cap and interpolates between steps.
+        step = 1.0 / GameSettings.SIM_RATE
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(GameSettings.FPS) / 1000.0
+            if self.throttled:
+                # In the background: one tick per frame at BACKGROUND_FPS keeps
+                # the online heartbeat going (the mixer plays on its own thread),
+                # and a minimized window is not rendered at all.
+                self.clock.tick(GameSettings.BACKGROUND_FPS)
+                self.handle_events()
+                self.update(step)
+                accumulator = 0.0
+                if not self.minimized:
+                    self.render()
+                continue
+
+            frame_dt = self.clock.tick(GameSettings.FPS) / 1000.0
+            quality_manager.record_frame(self.clock.get_rawtime())
+            # After a long hitch drop the backlog instead of replaying it
+            accumulator += min(frame_dt, step * GameSettings.MAX_SIM_STEPS)
             self.handle_events()
-            self.update(dt)
-            self.render()
+            while accumulator >= step:
+                self.update(step)
+                accumulator -= step
+            self.render(accumulator / step)
+
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Close the scenes (flushing recordings) and the render backend."""
+        scene_manager.close()
+        self.backend.close()
+        if self.input_recorder:
+            self.input_recorder.save()
+
+    @property
+    def throttled(self) -> bool:
+        """Minimized or unfocused, so running at BACKGROUND_FPS."""
+        return GameSettings.BACKGROUND_THROTTLE and (self.minimized or not self.focused)
+
+    @property
+    def screen(self) -> pg.Surface:
+        """Screen Display of the Game (the threaded backend swaps it every frame)"""
+        return self.backend.screen
+
+    def run_headless(self, ticks: int, script: InputScript | None = None,
+                     render: bool = True) -> float:
+        """
+        Run `ticks` fixed steps back to back, with no frame cap, feeding
+        `script` as the only input. Returns the wall-clock seconds taken.
+        """
+        Logger.info(f"Running {ticks} headless ticks ...")
+        step = 1.0 / GameSettings.SIM_RATE
+        start = time.perf_counter()
+        first_tick = self.tick
+        while self.running and self.tick - first_tick < ticks:
+            pg.event.clear()
+            if script:
+                for event in script.events_for(self.tick - first_tick):
+                    input_manager.handle_events(event)
+            self.update(step)
+            if render:
+                self.render()
+
+        elapsed = time.perf_counter() - start
+        done = self.tick - first_tick
+        Logger.info(f"Headless run: {done} ticks in {elapsed:.2f}s "
+                    f"({done / max(elapsed, 1e-9):.0f} ticks/s)")
+        return elapsed
 
     def handle_events(self):
-        input_manager.reset()
         for event in pg.event.get():
-            if event.type == pg.QUIT:
+            if self.input_recorder:
+                self.input_recorder.record(self.tick, event)
+            if event.type in (pg.QUIT, pg.WINDOWCLOSE):
                 self.running = False
+            elif event.type in (pg.WINDOWEXPOSED, pg.WINDOWRESTORED, pg.WINDOWSIZECHANGED):
+                # The window contents were lost, partial updates are not enough
+                self.full_redraw = True
+                if event.type != pg.WINDOWSIZECHANGED:
+                    self.minimized = False
+            elif event.type == pg.WINDOWMINIMIZED:
+                self.minimized = True
+            elif event.type in (pg.WINDOWFOCUSLOST, pg.WINDOWFOCUSGAINED):
+                self.focused = event.type == pg.WINDOWFOCUSGAINED
             input_manager.handle_events(event)
 
     def update(self, dt: float):
         scene_manager.update(dt)
+        self.tick += 1
+        # Pressed/released edges belong to the first tick that saw them,
+        # and survive frames that run no tick at all
+        input_manager.reset()
+
+    def render(self, alpha: float = 1.0):
+        rects = scene_manager.dirty_rects()
+        if self.full_redraw or not GameSettings.DIRTY_RECTS:
+            rects = None
+            self.full_redraw = False
+
+        if rects and not self.backend.supports_partial_updates:
+            rects = None
 
-    def render(self):
-        self.screen.fill((0, 0, 0))
-        scene_manager.draw(self.screen)  # Draw the current scene
-        pg.display.flip()               # Render the display
+        if rects is None:
+            self.backend.begin_frame()
+            scene_manager.draw(self.screen, alpha)  # Draw the current scene
+            self.backend.present()                  # Render the display
+        elif rects:
+            # Redraw the scene clipped to what changed and only push those regions
+            self.screen.set_clip(rects[0].unionall(rects[1:]))
+            self.screen.fill((0, 0, 0))
+            scene_manager.draw(self.screen, alpha)
+            self.screen.set_clip(None)
+            self.backend.present(rects)
@@ -3,4 +3,9 @@ from .input_manager import InputManager
 from .resource_manager import ResourceManager
 from .sound_manager import SoundManager
 from .game_manager import GameManager
-from .online_manager import OnlineManager
\ No newline at end of file
+from .online_manager import OnlineManager
+from .network_stats import NetworkStats
+from .traffic_recording import TrafficRecorder, generate_crowd_recording
+from .input_script import InputScript, InputRecorder
+from .quality_manager import QualityManager, QualityLevel, QUALITY_LEVELS
+from .debug_draw import DebugDraw, DebugMode
\ No newline at end of file
@@ -0,0 +1,135 @@
+import pygame as pg
+from collections import OrderedDict
+from enum import IntEnum
+from typing import Callable, Iterable
+
+from src.utils import GameSettings, PositionCamera, optimize_surface
+from .quality_manager import QualityManager
+
+STATIC_CHUNK_PX = 512       # Edge length of a baked static layer chunk
+MAX_STATIC_CHUNKS = 24      # Baked chunks kept, least recently drawn dropped first
+
+Color = tuple[int, int, int]
+# (color, world rect, width) or (color, (start, end), width) for a line
+Shape = tuple[Color, pg.Rect | tuple[tuple[int, int], tuple[int, int]], int]
+
+
+class DebugMode(IntEnum):
+    OFF = 0
+    HITBOXES = 1    # Entity hitboxes and the navigation path
+    WORLD = 2       # Also collision tiles, encounter zones and lines of sight
+
+
+class DebugDraw:
+    """
+    One place for debug drawing. Whoever knows about a shape queues it in
+    world coordinates while drawing; flush() puts them all on screen after
+    the world, at full resolution. Shapes that never move (collision tiles,
+    encounter zones) go into a static layer that is baked once into chunk
+    surfaces and then costs one blit per visible chunk.
+    F2 cycles the modes at runtime. While a shape's mode is not shown,
+    queueing it returns immediately; callers that loop to build shapes check
+    shows() first so that nothing at all is done.
+    """
+    mode: DebugMode
+
+    def __init__(self, quality: QualityManager) -> None:
+        self.mode = DebugMode.HITBOXES if GameSettings.DRAW_HITBOXES else DebugMode.OFF
+        self._quality = quality
+        self._shapes: list[tuple[str, Color, object, int]] = []
+        # Static layers: key -> shapes bucketed by the chunks they touch
+        self._static: dict[str, dict[tuple[int, int], list[Shape]]] = {}
+        self._static_keys: list[str] = []    # Static layers shown this frame
+        self._chunks: OrderedDict[tuple[str, int, int], pg.Surface] = OrderedDict()
+
+    def cycle(self) -> None:
+        self.mode = DebugMode((self.mode + 1) % len(DebugMode))
+        self._shapes.clear()
+        self._static_keys.clear()
+
+    def shows(self, mode: DebugMode = DebugMode.HITBOXES) -> bool:
+        """Whether shapes of `mode` are drawn this frame."""
+        return self.mode >= mode and self._quality.level.debug_draw
+
+    def rect(self, color: Color, rect: pg.Rect, width: int = 1,
+             mode: DebugMode = DebugMode.HITBOXES) -> None:
+        if self.shows(mode):
+            self._shapes.append(("rect", color, rect, width))
+
+    def line(self, color: Color, start: tuple[int, int], end: tuple[int, int],
+             width: int = 1, mode: DebugMode = DebugMode.HITBOXES) -> None:
+        if self.shows(mode):
+            self._shapes.append(("line", color, (start, end), width))
+
+    def static(self, key: str, build: Callable[[], Iterable[Shape]]) -> None:
+        """
+        Show the static layer `key` this frame. build() is only called the
+        first time the key is seen; call static() again every frame it should
+        stay visible.
+        """
+        if not self.shows(DebugMode.WORLD):
+            return
+        if key not in self._static:
+            buckets: dict[tuple[int, int], list[Shape]] = {}
+            for shape in build():
+                bounds = _shape_bounds(shape)
+                for cx in range(bounds.left // STATIC_CHUNK_PX, (bounds.right - 1) // STATIC_CHUNK_PX + 1):
+                    for cy in range(bounds.top // STATIC_CHUNK_PX, (bounds.bottom - 1) // STATIC_CHUNK_PX + 1):
+                        buckets.setdefault((cx, cy), []).append(shape)
+            self._static[key] = buckets
+        self._static_keys.append(key)
+
+    def flush(self, screen: pg.Surface, camera: PositionCamera) -> None:
+        """Draw everything queued this frame over the world and start the next frame empty."""
+        for key in self._static_keys:
+            self._draw_static(screen, camera, key)
+        self._static_keys.clear()
+
+        for kind, color, shape, width in self._shapes:
+            if kind == "rect":
+                pg.draw.rect(screen, color, camera.transform_rect(shape), width)
+            else:
+                start, end = shape
+                pg.draw.line(screen, color, (start[0] - camera.x, start[1] - camera.y),
+                             (end[0] - camera.x, end[1] - camera.y), width)
+        self._shapes.clear()
+
+    def _draw_static(self, screen: pg.Surface, camera: PositionCamera, key: str) -> None:
+        buckets = self._static[key]
+        w, h = screen.get_size()
+        size = STATIC_CHUNK_PX
+        blits = []
+        for cx in range(camera.x // size, (camera.x + w - 1) // size + 1):
+            for cy in range(camera.y // size, (camera.y + h - 1) // size + 1):
+                shapes = buckets.get((cx, cy))
+                if not shapes:
+                    continue
+                chunk = self._chunks.get((key, cx, cy))
+                if chunk is None:
+                    chunk = _bake_chunk(shapes, cx * size, cy * size)
+                    self._chunks[(key, cx, cy)] = chunk
+                    if len(self._chunks) > MAX_STATIC_CHUNKS:
+                        self._chunks.popitem(last=False)
+                else:
+                    self._chunks.move_to_end((key, cx, cy))
+                blits.append((chunk, (cx * size - camera.x, cy * size - camera.y)))
+        screen.blits(blits, False)
+
+
+def _shape_bounds(shape: Shape) -> pg.Rect:
+    _, geometry, width = shape
+    if isinstance(geometry, pg.Rect):
+        return geometry
+    (x1, y1), (x2, y2) = geometry
+    return pg.Rect(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1).inflate(width, width)
+
+
+def _bake_chunk(shapes: list[Shape], left: int, top: int) -> pg.Surface:
+    chunk = pg.Surface((STATIC_CHUNK_PX, STATIC_CHUNK_PX), pg.SRCALPHA)
+    for color, geometry, width in shapes:
+        if isinstance(geometry, pg.Rect):
+            pg.draw.rect(chunk, color, geometry.move(-left, -top), width)
+        else:
+            (x1, y1), (x2, y2) = geometry
+            pg.draw.line(chunk, color, (x1 - left, y1 - top), (x2 - left, y2 - top), width)
+    return optimize_surface(chunk)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from src.utils import Logger, GameSettings, Position, Teleport
+from src.utils import Logger, GameSettings, Position, Teleport, SpatialHash
 import json
 import os
 import pygame as pg
@@ -11,8 +11,11 @@ if TYPE_CHECKING:
     from src.entities.player import Player
     from src.entities.enemy_trainer import EnemyTrainer
     from src.entities.shop_npc import ShopNPC
+    from src.entities.entity import Entity
     from src.data.bag import Bag
 
+ENTITY_CELL_TILES = 4   # Edge length of an entity spatial hash cell in tiles
+
 
 class GameManager:
     # Entities
@@ -24,6 +27,7 @@ class GameManager:
     # Map properties
     current_map_key: str
     maps: dict[str, Map]
+    _entity_grids: dict[str, SpatialHash[Entity]]   # Trainers and NPCs per map, built on first use
 
     # Changing Scene properties
     should_change_scene: bool
@@ -42,6 +46,7 @@ class GameManager:
         self.player = player
         self.enemy_trainers = enemy_trainers
         self.shop_npc = shop_npc
+        self._entity_grids = {}
 
         self.bag = bag if bag is not None else Bag([], [])
 
@@ -76,6 +81,25 @@ class GameManager:
     def current_teleporter(self) -> list[Teleport]:
         return self.maps[self.current_map_key].teleporters
 
+    def entity_grid(self, map_key: str | None = None) -> SpatialHash[Entity]:
+        """Spatial hash of the enemy trainers and shop NPCs on a map (default: the current one)."""
+        key = map_key or self.current_map_key
+        grid = self._entity_grids.get(key)
+        if grid is None:
+            grid = SpatialHash(
+                GameSettings.TILE_SIZE * ENTITY_CELL_TILES, lambda entity: entity.animation.rect,
+                [*self.enemy_trainers.get(key, []), *self.shop_npc.get(key, [])])
+            self._entity_grids[key] = grid
+        return grid
+
+    def entity_moved(self, entity: Entity) -> None:
+        """Call after a trainer or NPC on the current map may have moved."""
+        self.entity_grid().move(entity)
+
+    def entities_in(self, rect: pg.Rect) -> list[Entity]:
+        """Trainers and NPCs on the current map overlapping `rect`."""
+        return self.entity_grid().query(rect)
+
     def request_map_change(self, tp: Teleport) -> None:
         self.should_change_scene = True
         self.next_map = tp.destination
@@ -106,17 +130,8 @@ class GameManager:
         if self.maps[self.current_map_key].check_collision(rect):
             return True
 
-        # Check collision with enemy trainers
-        for entity in self.current_enemy_trainers:
-            if rect.colliderect(entity.animation.rect):
-                return True
-
-        # Check collision with shop NPCs
-        for npc in self.current_shop_npc:
-            if rect.colliderect(npc.animation.rect):
-                return True
-
-        return False
+        # Then enemy trainers and shop NPCs in the cells around the rect
+        return self.entity_grid().any_collides(rect)
 
     def save(self, path: str) -> None:
         try:
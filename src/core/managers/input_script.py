@@ -0,0 +1,86 @@
+"""
+Input script format (plain JSON, easy to write by hand):
+    {"format": "monster-go-input", "version": 1,
+     "events": [[tick, type, value], ...]}
+type / value:
+    "keydown", "keyup"      : pygame key name, e.g. "right", "space", "z"
+    "mousedown", "mouseup"  : [button, x, y]
+    "mousemove"             : [x, y]
+Events are fed to the input manager right before simulation tick `tick`,
+counted from the start of the headless run.
+"""
+import json
+import pygame as pg
+
+from src.utils import Logger
+
+SCRIPT_FORMAT = "monster-go-input"
+SCRIPT_VERSION = 1
+
+ScriptEvent = tuple[int, str, object]
+
+
+class InputScript:
+    """Scripted or recorded input, replayed tick by tick."""
+
+    def __init__(self, events: list[ScriptEvent] | None = None):
+        self._by_tick: dict[int, list[pg.event.Event]] = {}
+        self.last_tick = -1
+        for tick, kind, value in events or []:
+            self._by_tick.setdefault(tick, []).append(_to_pygame(kind, value))
+            self.last_tick = max(self.last_tick, tick)
+
+    @classmethod
+    def load(cls, path: str) -> "InputScript":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != SCRIPT_FORMAT:
+            raise ValueError(f"{path} is not an input script")
+        return cls([(int(t), kind, value) for t, kind, value in data["events"]])
+
+    def events_for(self, tick: int) -> list[pg.event.Event]:
+        return self._by_tick.get(tick, [])
+
+
+class InputRecorder:
+    """Collects the events of a normal run so it can be replayed headless."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._events: list[ScriptEvent] = []
+
+    def record(self, tick: int, event: pg.event.Event) -> None:
+        entry = _from_pygame(event)
+        if entry is not None:
+            self._events.append((tick, *entry))
+
+    def save(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"format": SCRIPT_FORMAT, "version": SCRIPT_VERSION,
+                       "events": self._events}, f)
+        Logger.info(f"Saved {len(self._events)} input events to {self.path}")
+
+
+def _to_pygame(kind: str, value) -> pg.event.Event:
+    if kind in ("keydown", "keyup"):
+        key = pg.key.key_code(value) if isinstance(value, str) else int(value)
+        return pg.event.Event(pg.KEYDOWN if kind == "keydown" else pg.KEYUP, key=key)
+    if kind in ("mousedown", "mouseup"):
+        button, x, y = value
+        return pg.event.Event(pg.MOUSEBUTTONDOWN if kind == "mousedown" else pg.MOUSEBUTTONUP,
+                              button=button, pos=(x, y))
+    if kind == "mousemove":
+        return pg.event.Event(pg.MOUSEMOTION, pos=tuple(value))
+    raise ValueError(f"Unknown input event type: {kind}")
+
+
+def _from_pygame(event: pg.event.Event) -> tuple[str, object] | None:
+    if event.type in (pg.KEYDOWN, pg.KEYUP):
+        kind = "keydown" if event.type == pg.KEYDOWN else "keyup"
+        return kind, pg.key.name(event.key) or event.key
+    if event.type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+        kind = "mousedown" if event.type == pg.MOUSEBUTTONDOWN else "mouseup"
+        return kind, [event.button, *event.pos]
+    if event.type == pg.MOUSEMOTION:
+        return "mousemove", list(event.pos)
+    return None
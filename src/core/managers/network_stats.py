@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import deque
+
+HISTORY_LENGTH = 120        # samples kept for graphs
+SAMPLE_INTERVAL = 0.25      # seconds between graph samples
+RATE_WINDOW = 1.0           # seconds used for per-second rates
+
+
+class NetworkStats:
+    """
+    Thread-safe counters for OnlineManager traffic.
+    The poller thread and the main thread both record into it, the overlay
+    and benchmarks read from it through snapshot() and history().
+    """
+    rtt_samples: deque[float]
+    history_rtt: deque[float]
+    history_requests: deque[float]
+    history_bytes_sent: deque[float]
+    history_bytes_received: deque[float]
+    history_snapshot_age: deque[float]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.errors = 0
+            self.timeouts = 0
+            self.rtt_samples = deque(maxlen=HISTORY_LENGTH)
+            self._recent: deque[tuple[float, int, int]] = deque()
+            self._last_snapshot: float | None = None
+            self._last_sample = time.monotonic()
+
+            self.history_rtt = deque(maxlen=HISTORY_LENGTH)
+            self.history_requests = deque(maxlen=HISTORY_LENGTH)
+            self.history_bytes_sent = deque(maxlen=HISTORY_LENGTH)
+            self.history_bytes_received = deque(maxlen=HISTORY_LENGTH)
+            self.history_snapshot_age = deque(maxlen=HISTORY_LENGTH)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def record_request(self, rtt: float, sent: int, received: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += sent
+            self.bytes_received += received
+            self.rtt_samples.append(rtt * 1000.0)
+            self._recent.append((now, sent, received))
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def mark_snapshot(self) -> None:
+        """Call whenever a fresh player list has been received."""
+        with self._lock:
+            self._last_snapshot = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _trim_recent(self, now: float) -> None:
+        while self._recent and now - self._recent[0][0] > RATE_WINDOW:
+            self._recent.popleft()
+
+    def _rates(self, now: float) -> tuple[float, float, float]:
+        self._trim_recent(now)
+        count = len(self._recent)
+        sent = sum(r[1] for r in self._recent)
+        received = sum(r[2] for r in self._recent)
+        return count / RATE_WINDOW, sent / RATE_WINDOW, received / RATE_WINDOW
+
+    def _snapshot_age(self, now: float) -> float | None:
+        if self._last_snapshot is None:
+            return None
+        return now - self._last_snapshot
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        """Current totals and rates, for benchmarks and logging."""
+        now = time.monotonic()
+        with self._lock:
+            req_rate, sent_rate, recv_rate = self._rates(now)
+            rtts = list(self.rtt_samples)
+            return {
+                "requests": self.requests,
+                "requests_per_sec": req_rate,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "bytes_sent_per_sec": sent_rate,
+                "bytes_received_per_sec": recv_rate,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "rtt_last_ms": rtts[-1] if rtts else None,
+                "rtt_avg_ms": sum(rtts) / len(rtts) if rtts else None,
+                "rtt_max_ms": max(rtts) if rtts else None,
+                "snapshot_age": self._snapshot_age(now),
+            }
+
+    def sample(self) -> None:
+        """Push one point into the graph histories, at most every SAMPLE_INTERVAL."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sample < SAMPLE_INTERVAL:
+                return
+            self._last_sample = now
+            req_rate, sent_rate, recv_rate = self._rates(now)
+            self.history_rtt.append(
+                self.rtt_samples[-1] if self.rtt_samples else 0.0)
+            self.history_requests.append(req_rate)
+            self.history_bytes_sent.append(sent_rate)
+            self.history_bytes_received.append(recv_rate)
+            age = self._snapshot_age(now)
+            self.history_snapshot_age.append(
+                age * 1000.0 if age is not None else 0.0)
+
+    def history(self) -> dict[str, list[float]]:
+        with self._lock:
+            return {
+                "rtt_ms": list(self.history_rtt),
+                "requests_per_sec": list(self.history_requests),
+                "bytes_sent_per_sec": list(self.history_bytes_sent),
+                "bytes_received_per_sec": list(self.history_bytes_received),
+                "snapshot_age_ms": list(self.history_snapshot_age),
+            }
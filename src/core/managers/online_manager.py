@@ -1,13 +1,18 @@
-import requests
 import threading
 import time
 from src.utils import Logger, GameSettings
+from .network_stats import NetworkStats
+from .online_transport import Transport, TransportResponse, ReplayTransport, create_transport
+from .traffic_recording import TrafficRecorder
 
 POLL_INTERVAL = 0.02
 
 class OnlineManager:
     list_players: list[dict]
     player_id: int
+    stats: NetworkStats
+    transport: Transport
+    recorder: TrafficRecorder | None
     
     _stop_event: threading.Event
     _thread: threading.Thread | None
@@ -17,6 +22,17 @@ class OnlineManager:
         self.base: str = GameSettings.ONLINE_SERVER_URL
         self.player_id = -1
         self.list_players = []
+        self.stats = NetworkStats()
+
+        # Replay a recording instead of talking to the server
+        if GameSettings.ONLINE_REPLAY_PATH:
+            self.transport = ReplayTransport(GameSettings.ONLINE_REPLAY_PATH)
+        else:
+            self.transport = create_transport(self.base)
+
+        self.recorder = None
+        if GameSettings.ONLINE_RECORD_PATH:
+            self.recorder = TrafficRecorder(GameSettings.ONLINE_RECORD_PATH)
 
         self._thread = None
         self._stop_event = threading.Event()
@@ -30,18 +46,49 @@ class OnlineManager:
             
     def exit(self):
         self.stop()
+        # The poller thread and its connection end here; enter() opens new ones
+        self.transport.close()
+
+    def close(self):
+        """Shut down for good: the recording spans every enter()/exit() until now."""
+        self.exit()
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
         
     def get_list_players(self) -> list[dict]:
         with self._lock:
             return list(self.list_players)
 
+    def get_stats(self) -> dict[str, float | int | None]:
+        """Network counters (RTT, rates, bytes, errors, snapshot age) for benchmarks."""
+        return self.stats.snapshot()
+
     # ------------------------------------------------------------------
     # Threading and API Calling Below
     # ------------------------------------------------------------------
+    def _request(self, method: str, path: str, body: dict | None = None) -> TransportResponse:
+        """Send one request through the transport, recording it in self.stats."""
+        start = time.monotonic()
+        try:
+            resp = self.transport.request(method, path, body)
+        except TimeoutError:
+            self.stats.record_timeout()
+            raise
+        except ConnectionError:
+            self.stats.record_error()
+            raise
+        self.stats.record_request(
+            time.monotonic() - start, resp.sent, len(resp.content))
+        if resp.status_code != 200:
+            self.stats.record_error()
+        if self.recorder:
+            self.recorder.record(method, path, resp.status_code, resp.content)
+        return resp
+
     def register(self):
         try:
-            url = f"{self.base}/register"
-            resp = requests.get(url, timeout=5)
+            resp = self._request("GET", "/register")
             resp.raise_for_status()
             data = resp.json()
             if resp.status_code == 200:
@@ -58,14 +105,13 @@ class OnlineManager:
             # Try to register again
             return False
         
-        url = f"{self.base}/players"
         body = {"id": self.player_id, "x": x, "y": y, "map": map_name}
         if direction:
             body["dir"] = direction
         if sprite:
             body["sprite"] = sprite
         try:
-            resp = requests.post(url, json=body, timeout=5)
+            resp = self._request("POST", "/players", body)
             if resp.status_code == 200:
                 return True
             Logger.warning(f"Update failed: {resp.status_code} {resp.text}")
@@ -95,8 +141,7 @@ class OnlineManager:
             
     def _fetch_players(self) -> None:
         try:
-            url = f"{self.base}/players"
-            resp = requests.get(url, timeout=5)
+            resp = self._request("GET", "/players")
             resp.raise_for_status()
             all_players = resp.json().get("players", [])
 
@@ -109,6 +154,7 @@ class OnlineManager:
                 filtered.append(p)
             with self._lock:
                 self.list_players = filtered
+            self.stats.mark_snapshot()
             
         except Exception as e:
             Logger.warning(f"OnlineManager fetch error: {e}")
@@ -118,10 +164,9 @@ class OnlineManager:
         if self.player_id == -1:
             return False
         
-        url = f"{self.base}/chat"
         body = {"id": self.player_id, "text": text}
         try:
-            resp = requests.post(url, json=body, timeout=5)
+            resp = self._request("POST", "/chat", body)
             if resp.status_code == 200:
                 return True
             Logger.warning(f"Send message failed: {resp.status_code} {resp.text}")
@@ -132,8 +177,7 @@ class OnlineManager:
     def get_recent_chat(self, limit: int = 50) -> list[dict]:
         """Get recent chat messages from the server."""
         try:
-            url = f"{self.base}/chat"
-            resp = requests.get(url, timeout=5)
+            resp = self._request("GET", "/chat")
             resp.raise_for_status()
             data = resp.json()
             messages = data.get("messages", [])
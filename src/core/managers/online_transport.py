@@ -0,0 +1,181 @@
+import bisect
+import json
+import socket
+import struct
+import threading
+import time
+import requests
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.utils import Logger
+from .traffic_recording import load_recording
+
+REQUEST_TIMEOUT = 5
+UNIX_SCHEME = "unix://"
+
+# Framing shared with server/ipcServer.py
+FRAME_HEADER = struct.Struct(">I")
+STATUS_HEADER = struct.Struct(">H")
+
+
+@dataclass
+class TransportResponse:
+    status_code: int
+    content: bytes
+    sent: int = 0           # request body size in bytes
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise ConnectionError(f"HTTP {self.status_code}: {self.text}")
+
+
+class Transport(Protocol):
+    """
+    How OnlineManager reaches the server.
+    Raises TimeoutError on timeouts and ConnectionError on other failures.
+    """
+    def request(self, method: str, path: str, body: dict | None = None) -> TransportResponse: ...
+    def close(self) -> None: ...
+
+
+class HttpTransport:
+    """The default transport: plain HTTP against server.py."""
+
+    def __init__(self, base: str):
+        self.base = base
+        self._session = requests.Session()
+
+    def request(self, method: str, path: str, body: dict | None = None) -> TransportResponse:
+        try:
+            resp = self._session.request(
+                method, f"{self.base}{path}", json=body, timeout=REQUEST_TIMEOUT)
+        except requests.Timeout as e:
+            raise TimeoutError(str(e)) from e
+        except requests.RequestException as e:
+            raise ConnectionError(str(e)) from e
+        sent = resp.request.body or b""
+        return TransportResponse(resp.status_code, resp.content, len(sent))
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class UnixSocketTransport:
+    """
+    Talks to server.py over its unix domain socket (ONLINE_SERVER_URL = "unix:///path").
+    Each thread keeps one persistent connection, so the poller and the
+    main thread never wait on each other.
+    """
+
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self._local = threading.local()
+        self._sockets: list[socket.socket] = []
+        self._sockets_lock = threading.Lock()
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None or sock.fileno() == -1:     # Never opened, or close()d
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(REQUEST_TIMEOUT)
+            sock.connect(self.socket_path)
+            self._local.sock = sock
+            with self._sockets_lock:
+                self._sockets.append(sock)
+        return sock
+
+    def _drop_connection(self) -> None:
+        sock = getattr(self._local, "sock", None)
+        self._local.sock = None
+        if sock is not None:
+            with self._sockets_lock:
+                if sock in self._sockets:
+                    self._sockets.remove(sock)
+            sock.close()
+
+    def _recv_exact(self, sock: socket.socket, size: int) -> bytes:
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("IPC server closed the connection")
+            buf += chunk
+        return bytes(buf)
+
+    def request(self, method: str, path: str, body: dict | None = None) -> TransportResponse:
+        payload = f"{method} {path}\n".encode("utf-8")
+        if body is not None:
+            payload += json.dumps(body, separators=(",", ":")).encode("utf-8")
+        try:
+            sock = self._connection()
+            sock.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+            (length,) = FRAME_HEADER.unpack(
+                self._recv_exact(sock, FRAME_HEADER.size))
+            data = self._recv_exact(sock, length)
+        except (TimeoutError, OSError) as e:
+            self._drop_connection()
+            if isinstance(e, TimeoutError):
+                raise
+            raise ConnectionError(str(e)) from e
+        (status,) = STATUS_HEADER.unpack_from(data)
+        return TransportResponse(status, data[STATUS_HEADER.size:], len(payload))
+
+    def close(self) -> None:
+        with self._sockets_lock:
+            for sock in self._sockets:
+                sock.close()
+            self._sockets.clear()
+
+
+def create_transport(base: str) -> Transport:
+    """Pick the transport from the ONLINE_SERVER_URL scheme."""
+    if base.startswith(UNIX_SCHEME):
+        return UnixSocketTransport(base[len(UNIX_SCHEME):])
+    return HttpTransport(base)
+
+
+class ReplayTransport:
+    """
+    Stand-in server that answers from a recording made by TrafficRecorder.
+    Each request gets the latest response recorded for the same method and
+    path at the current replay time; the recording loops when it runs out.
+    """
+
+    def __init__(self, path: str):
+        self._responses: dict[tuple[str, str], tuple[list[float], list[tuple[int, bytes]]]] = {}
+        self.duration = 0.0
+        for t, method, req_path, status, content in load_recording(path):
+            times, entries = self._responses.setdefault((method, req_path), ([], []))
+            times.append(t)
+            entries.append((status, content))
+            self.duration = max(self.duration, t)
+        self._start: float | None = None
+        Logger.info(f"Replaying {path} ({self.duration:.1f}s)")
+
+    def _elapsed(self) -> float:
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        elapsed = now - self._start
+        return elapsed % self.duration if self.duration > 0 else elapsed
+
+    def request(self, method: str, path: str, body: dict | None = None) -> TransportResponse:
+        sent = len(json.dumps(body).encode("utf-8")) if body is not None else 0
+        recorded = self._responses.get((method, path))
+        if recorded is None:
+            return TransportResponse(404, b'{"error": "not_in_recording"}', sent)
+        times, entries = recorded
+        idx = max(0, bisect.bisect_right(times, self._elapsed()) - 1)
+        status, content = entries[idx]
+        return TransportResponse(status, content, sent)
+
+    def close(self) -> None:
+        return
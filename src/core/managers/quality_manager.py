@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+
+from src.utils import GameSettings, Logger
+
+SMOOTHING = 0.1             # Weight of the newest frame in the frame time average
+DOWNGRADE_FRAMES = 30       # Frames over budget before quality drops a level
+UPGRADE_FRAMES = 240        # Frames well under budget before quality rises a level
+MAX_UPGRADE_FRAMES = 3840   # Longest wait after upgrades that kept being undone
+UPGRADE_HEADROOM = 0.6      # "Well under budget": below this fraction of the target
+HITCH_MS = 250.0            # Longer frames are one-offs (loading, window drags), not load
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    name: str
+    render_scale: float     # World render resolution relative to the screen
+    smooth_scale: bool      # smoothscale (vs. scale) when resizing sprites for it
+    minimap_interval: int   # Frames between minimap marker redraws
+    debug_draw: bool        # Debug shapes (when toggled on)
+    remote_margin: float    # Fraction of REMOTE_PLAYER_MARGIN where remote players animate
+
+
+# Best first. Scaling the world only pays off once the saved blits outweigh
+# the upscale, which in software is at half resolution.
+QUALITY_LEVELS = (
+    QualityLevel("high", 1.0, True, 1, True, 1.0),
+    QualityLevel("medium", 1.0, True, 3, False, 0.5),
+    QualityLevel("low", 0.5, False, 6, False, 0.0),
+)
+
+
+class QualityManager:
+    """
+    Frame time governor. The engine reports how long each frame's work took;
+    when the average stays over the budget quality drops a level, and when it
+    stays well under, quality comes back. Drawing code reads the knobs below.
+    """
+    level_index: int
+    frame_ms: float         # Smoothed frame time
+    last_frame_ms: float    # Latest frame's work time, hitches included
+    frames: int             # Frames recorded so far
+
+    def __init__(self) -> None:
+        self.level_index = 0
+        self.frame_ms = 0.0
+        self.last_frame_ms = 0.0
+        self.frames = 0
+        self._over = 0
+        self._under = 0
+        self._upgrade_frames = UPGRADE_FRAMES
+        self._raised = False    # Last change was an upgrade
+
+    @property
+    def level(self) -> QualityLevel:
+        return QUALITY_LEVELS[self.level_index]
+
+    @property
+    def target_ms(self) -> float:
+        return GameSettings.TARGET_FRAME_MS or 1000.0 / GameSettings.FPS
+
+    @property
+    def remote_margin(self) -> int:
+        return int(GameSettings.REMOTE_PLAYER_MARGIN * self.level.remote_margin)
+
+    def set_level(self, index: int) -> None:
+        index = max(0, min(index, len(QUALITY_LEVELS) - 1))
+        if index != self.level_index:
+            Logger.info(f"Quality {self.level.name} -> {QUALITY_LEVELS[index].name} "
+                        f"({self.frame_ms:.1f} ms/frame, target {self.target_ms:.1f} ms)")
+            self.level_index = index
+        self._over = self._under = 0
+
+    def record_frame(self, work_ms: float) -> None:
+        """Feed the time one frame spent working (not waiting for the frame cap)."""
+        self.last_frame_ms = work_ms
+        self.frames += 1
+        if work_ms > HITCH_MS:
+            return
+        if not self.frame_ms:
+            self.frame_ms = work_ms
+        self.frame_ms += (work_ms - self.frame_ms) * SMOOTHING
+        if not GameSettings.ADAPTIVE_QUALITY:
+            return
+
+        target = self.target_ms
+        self._over = self._over + 1 if self.frame_ms > target else 0
+        self._under = self._under + 1 if self.frame_ms < target * UPGRADE_HEADROOM else 0
+        if self._over >= DOWNGRADE_FRAMES:
+            if self._raised:
+                # The better level did not hold: wait longer before retrying it
+                self._upgrade_frames = min(self._upgrade_frames * 2, MAX_UPGRADE_FRAMES)
+            self._raised = False
+            self.set_level(self.level_index + 1)
+        elif self._under >= self._upgrade_frames and self.level_index > 0:
+            self._raised = True
+            self.set_level(self.level_index - 1)
@@ -1,5 +1,13 @@
 import pygame as pg
-from src.utils import load_img, load_font, load_sound
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from src.utils import load_img, decode_img, load_font, load_sound, to_display_format, optimize_surface
+
+AnimationKey = tuple[str, tuple[str, ...], int, tuple[int, int]]
+TextKey = tuple[pg.font.Font, str, tuple[int, ...], bool]
+
+TEXT_CACHE_SIZE = 512   # Rendered strings kept around (least recently used are dropped)
 
 class ResourceManager:
     """
@@ -10,12 +18,68 @@ class ResourceManager:
         self._images: dict[str, pg.Surface] = {}
         self._sounds: dict[str, pg.mixer.Sound] = {}
         self._fonts: dict[tuple[str, int], pg.font.Font] = {}
+        self._sys_fonts: dict[tuple[str | None, int], pg.font.Font] = {}
+        self._texts: OrderedDict[TextKey, pg.Surface] = OrderedDict()
+        self._animations: dict[AnimationKey, dict[str, list[pg.Surface]]] = {}
+
+        # Images decoded on a worker thread, waiting to be converted on the main thread
+        self._pending: dict[str, Future[pg.Surface]] = {}
+        self._pending_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
 
     def get_image(self, path: str) -> pg.Surface:
         if path not in self._images:
-            self._images[path] = load_img(path)
+            with self._pending_lock:
+                future = self._pending.pop(path, None)
+            if future is not None:
+                self._images[path] = to_display_format(future.result())
+            else:
+                self._images[path] = load_img(path)
         return self._images[path]
 
+    def prefetch_image(self, path: str) -> None:
+        """Start decoding an image in the background so get_image() only has to convert it."""
+        with self._pending_lock:
+            if path in self._images or path in self._pending:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="ResourcePrefetch")
+            self._pending[path] = self._executor.submit(decode_img, path)
+
+    def is_image_ready(self, path: str) -> bool:
+        """True when get_image(path) will not block on disk or decoding."""
+        if path in self._images:
+            return True
+        with self._pending_lock:
+            future = self._pending.get(path)
+        return future is not None and future.done()
+
+    def get_animation_frames(
+        self, path: str, rows: list[str], n_keyframes: int, size: tuple[int, int]
+    ) -> dict[str, list[pg.Surface]]:
+        """Slice and scale a sprite sheet once; every Animation on that sheet shares the frames."""
+        key = (path, tuple(rows), n_keyframes, size)
+        if key not in self._animations:
+            sheet = self.get_image(path)
+            sheet_w, sheet_h = sheet.get_size()
+            frame_w = sheet_w // n_keyframes
+            frame_h = sheet_h // len(rows)
+
+            animations: dict[str, list[pg.Surface]] = {}
+            for r, name in enumerate(rows):
+                anim: list[pg.Surface] = []
+                for c in range(n_keyframes):
+                    frame = sheet.subsurface(pg.Rect(
+                        c * frame_w, r * frame_h,
+                        frame_w, frame_h
+                    ))
+                    anim.append(optimize_surface(
+                        pg.transform.smoothscale(frame, size)))
+                animations[name] = anim
+            self._animations[key] = animations
+        return self._animations[key]
+
     def get_sound(self, path: str) -> pg.mixer.Sound:
         if path not in self._sounds:
             self._sounds[path] = load_sound(path)
@@ -27,8 +91,39 @@ class ResourceManager:
             self._fonts[key] = load_font(path, size)
         return self._fonts[key]
 
+    def get_sys_font(self, name: str | None, size: int) -> pg.font.Font:
+        """Shared pg.font.SysFont instance; name None is pygame's default font."""
+        key = (name, size)
+        if key not in self._sys_fonts:
+            self._sys_fonts[key] = pg.font.SysFont(name, size)
+        return self._sys_fonts[key]
+
+    def render_text(
+        self, font: pg.font.Font, text: str,
+        color: tuple[int, ...], antialias: bool = True
+    ) -> pg.Surface:
+        """
+        font.render() behind an LRU cache. The surface is shared between
+        callers, so blit it but never draw onto it.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._texts.get(key)
+        if surface is None:
+            surface = font.render(text, antialias, color)
+            self._texts[key] = surface
+            if len(self._texts) > TEXT_CACHE_SIZE:
+                self._texts.popitem(last=False)
+        else:
+            self._texts.move_to_end(key)
+        return surface
+
     def clear(self) -> None:
         """Clear all cached assets (useful when switching levels)."""
         self._images.clear()
         self._sounds.clear()
         self._fonts.clear()
+        self._sys_fonts.clear()
+        self._texts.clear()
+        self._animations.clear()
+        with self._pending_lock:
+            self._pending.clear()
@@ -33,10 +33,24 @@ class SceneManager:
         if self._current_scene:
             self._current_scene.update(dt)
 
-    def draw(self, screen: pg.Surface) -> None:
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> None:
         if self._current_scene:
+            self._current_scene.render_alpha = alpha
             self._current_scene.draw(screen)
 
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        if self._current_scene:
+            return self._current_scene.dirty_rects()
+        return None
+
+    def close(self) -> None:
+        """Exit the current scene and close every registered one."""
+        if self._current_scene:
+            self._current_scene.exit()
+            self._current_scene = None
+        for scene in self._scenes.values():
+            scene.close()
+
     def _perform_scene_switch(self) -> None:
         if self._next_scene is None:
             return
@@ -51,6 +65,7 @@ class SceneManager:
         if self._current_scene:
             Logger.info(f"Entering {self._next_scene} scene")
             self._current_scene.enter()
+            self._current_scene.mark_dirty()
 
         # Clear the transition request
         self._next_scene = None
@@ -1,14 +1,23 @@
 import pygame as pg
-from src.utils import load_sound, GameSettings
+from src.utils import load_sound, GameSettings, Logger
 
 class SoundManager:
     def __init__(self):
-        pg.mixer.init()
-        pg.mixer.set_num_channels(GameSettings.MAX_CHANNELS)
         self.current_bgm = None
         self.muted = False
+        # Without audio every call below is a no-op
+        self.enabled = not GameSettings.HEADLESS
+        if self.enabled:
+            try:
+                pg.mixer.init()
+                pg.mixer.set_num_channels(GameSettings.MAX_CHANNELS)
+            except pg.error as e:
+                Logger.warning(f"Audio unavailable, continuing without sound: {e}")
+                self.enabled = False
         
     def play_bgm(self, filepath: str):
+        if not self.enabled:
+            return
         if self.current_bgm:
             self.current_bgm.stop()
         audio = load_sound(filepath)
@@ -18,18 +27,23 @@ class SoundManager:
         self.current_bgm = audio
         
     def pause_all(self):
-        pg.mixer.pause()
+        if self.enabled:
+            pg.mixer.pause()
 
     def resume_all(self):
-        pg.mixer.unpause()
+        if self.enabled:
+            pg.mixer.unpause()
         
     def play_sound(self, filepath, volume=0.7):
+        if not self.enabled:
+            return
         sound = load_sound(filepath)
         sound.set_volume(volume)
         sound.play()
 
     def stop_all_sounds(self):
-        pg.mixer.stop()
+        if self.enabled:
+            pg.mixer.stop()
         self.current_bgm = None
     
     def set_volume(self, volume: float):
@@ -0,0 +1,111 @@
+"""
+Recording format: gzip-compressed JSON lines.
+The first line is a header, every following line is one response:
+    [seconds_since_start, method, path, status, body]
+"""
+import gzip
+import json
+import math
+import random
+import threading
+import time
+from typing import Iterator
+
+from src.utils import Logger, GameSettings
+
+RECORDING_FORMAT = "monster-go-traffic"
+RECORDING_VERSION = 1
+
+RecordEntry = tuple[float, str, str, int, bytes]
+
+
+class TrafficRecorder:
+    """Appends every response OnlineManager receives to a recording file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._file.write(json.dumps(
+            {"format": RECORDING_FORMAT, "version": RECORDING_VERSION}) + "\n")
+        Logger.info(f"Recording network traffic to {path}")
+
+    def record(self, method: str, path: str, status: int, content: bytes) -> None:
+        t = round(time.monotonic() - self._start, 4)
+        line = json.dumps(
+            [t, method, path, status, content.decode("utf-8", errors="replace")],
+            separators=(",", ":"))
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def load_recording(path: str) -> Iterator[RecordEntry]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"{path} is not a traffic recording")
+        for line in f:
+            if not line.strip():
+                continue
+            t, method, req_path, status, body = json.loads(line)
+            yield float(t), method, req_path, int(status), body.encode("utf-8")
+
+
+def generate_crowd_recording(
+    path: str,
+    players: int = 200,
+    seconds: float = 30.0,
+    rate: float = 20.0,
+    map_name: str = "map.tmx",
+    center: tuple[int, int] = (26, 25),
+    seed: int = 0
+) -> None:
+    """
+    Write a synthetic recording of a crowd walking in circles around `center`
+    (in tiles), so rendering under heavy load can be benchmarked offline.
+    """
+    rng = random.Random(seed)
+    tile = GameSettings.TILE_SIZE
+    walkers = [
+        (rng.uniform(1, 12) * tile, rng.uniform(0, math.tau),
+         rng.uniform(0.2, 1.0) * rng.choice((-1, 1)),
+         f"character/ow{rng.randint(1, 3)}.png")
+        for _ in range(players)
+    ]
+    own_id = players
+
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps(
+            {"format": RECORDING_FORMAT, "version": RECORDING_VERSION}) + "\n")
+
+        def write(t: float, method: str, req_path: str, body: dict) -> None:
+            f.write(json.dumps([round(t, 4), method, req_path, 200, json.dumps(body)],
+                               separators=(",", ":")) + "\n")
+
+        write(0.0, "GET", "/register",
+              {"message": "registration successful", "id": own_id})
+        write(0.0, "POST", "/players", {"success": True})
+
+        for step in range(int(seconds * rate)):
+            t = step / rate
+            snapshot = {}
+            for pid, (radius, phase, speed, sprite) in enumerate(walkers):
+                angle = phase + speed * t
+                snapshot[str(pid)] = {
+                    "id": pid,
+                    "x": center[0] * tile + math.cos(angle) * radius,
+                    "y": center[1] * tile + math.sin(angle) * radius,
+                    "map": map_name,
+                    "sprite": sprite,
+                }
+            write(t, "GET", "/players", {"players": snapshot})
+
+    Logger.info(f"Wrote synthetic crowd recording to {path}")
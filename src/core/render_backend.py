@@ -0,0 +1,341 @@
+"""
+Where a frame ends up on screen.
+
+surface: the default. Everything is blitted in software onto the set_mode
+         display surface.
+texture: pygame._sdl2 Renderer. Map chunks and sprite frames, which never
+         change after loading, are uploaded once as textures and drawn by
+         the renderer. The rest (UI, text, pg.draw shapes) is still drawn in
+         software onto a transparent layer that is uploaded once per frame
+         and composited on top.
+threaded: software, pipelined. The main thread records frame N (world blits
+         as a list, UI on a transparent layer) while a render thread
+         composites and flips frame N-1. pygame releases the GIL inside
+         blits and flips, so the two overlap on multi-core machines.
+"""
+import threading
+import weakref
+import pygame as pg
+from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Protocol
+
+from src.utils import GameSettings, Logger, resample_surface
+
+BlitSequence = Iterable[tuple[pg.Surface, pg.Rect | tuple[int, int]]]
+
+
+class RenderBackend(Protocol):
+    screen: pg.Surface
+    supports_partial_updates: bool
+
+    def begin_frame(self) -> None: ...
+    def present(self, rects: list[pg.Rect] | None = None) -> None: ...
+    def close(self) -> None: ...
+
+
+class SurfaceBackend:
+    supports_partial_updates = True
+
+    def __init__(self, size: tuple[int, int]):
+        self.screen = pg.display.set_mode(size)
+
+    def begin_frame(self) -> None:
+        self.screen.fill((0, 0, 0))
+
+    def present(self, rects: list[pg.Rect] | None = None) -> None:
+        if rects is None:
+            pg.display.flip()
+        else:
+            pg.display.update(rects)
+
+    def close(self) -> None:
+        return
+
+
+class WorldCanvas(pg.Surface, metaclass=ABCMeta):
+    """
+    A `screen` that keeps world blits apart from the software UI layer
+    (the surface itself). copy() must return the composited frame.
+    """
+
+    def __new__(cls, *args, **kwargs):
+        # pg.Surface allocates without object.__new__, which is where
+        # abstract classes are normally refused
+        if cls.__abstractmethods__:
+            raise TypeError(f"Can't instantiate abstract class {cls.__name__} without "
+                            f"{', '.join(sorted(cls.__abstractmethods__))}")
+        return super().__new__(cls, *args, **kwargs)
+
+    @abstractmethod
+    def blit_world(self, blits: BlitSequence) -> None: ...
+
+
+class ReducedCanvas(WorldCanvas):
+    """
+    Offscreen world layer at `scale` of the screen resolution. Callers keep
+    drawing in screen coordinates; blit_world scales sprites and positions
+    down, then upscale_to() stretches the result over the screen.
+    """
+    scale: float
+    smooth: bool
+    logical_size: tuple[int, int]   # Size of the screen this stands in for
+
+    def blit_world(self, blits: BlitSequence) -> None:
+        scale, smooth = self.scale, self.smooth
+        self.blits([
+            (scaled_surface(surface, scale, smooth),
+             (round(dest[0] * scale), round(dest[1] * scale)))
+            for surface, dest in blits
+        ], False)
+
+    def upscale_to(self, screen: pg.Surface) -> None:
+        pg.transform.scale(self, screen.get_size(), screen)
+
+
+class TextureCanvas(WorldCanvas):
+    """The `screen` scenes draw on under the texture backend: the software UI layer."""
+    backend: "TextureBackend"
+
+    def blit_world(self, blits: BlitSequence) -> None:
+        renderer = self.backend.renderer
+        texture_for = self.backend.texture_for
+        for surface, dest in blits:
+            x, y = dest[0], dest[1]
+            w, h = surface.get_size()
+            renderer.blit(texture_for(surface), pg.Rect(x, y, w, h))
+
+    def copy(self) -> pg.Surface:
+        """What is on screen so far: the rendered world with the UI layer on top."""
+        snapshot = self.backend.renderer.to_surface()
+        snapshot.blit(pg.Surface.copy(self), (0, 0))
+        return snapshot
+
+
+class TextureBackend:
+    # The renderer's back buffer is undefined after present(), so every
+    # frame is drawn in full
+    supports_partial_updates = False
+
+    def __init__(self, size: tuple[int, int]):
+        from pygame._sdl2.video import Window, Renderer, Texture
+
+        # convert()/convert_alpha() (and pytmx) need a display mode for the
+        # pixel format; the window that is actually shown is the renderer's.
+        pg.display.set_mode((1, 1), pg.HIDDEN)
+
+        self.window = Window(GameSettings.TITLE, size)
+        try:
+            self.renderer = Renderer(self.window, vsync=False)
+        except pg.error:
+            # No GPU driver: SDL's software renderer
+            self.renderer = Renderer(self.window, accelerated=0, vsync=False)
+
+        self.screen = TextureCanvas(size, pg.SRCALPHA)
+        self.screen.backend = self
+        self._ui_layer = Texture(self.renderer, size, streaming=True)
+        self._ui_layer.blend_mode = 1   # SDL_BLENDMODE_BLEND
+        self._textures: weakref.WeakKeyDictionary[pg.Surface, Texture] = weakref.WeakKeyDictionary()
+        self._texture_cls = Texture
+
+    def texture_for(self, surface: pg.Surface):
+        """Texture uploaded from `surface` the first time it is drawn."""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._texture_cls.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+        return texture
+
+    def invalidate(self, surface: pg.Surface) -> None:
+        """Call after drawing onto a surface that may already be a texture."""
+        self._textures.pop(surface, None)
+
+    def update_region(self, surface: pg.Surface, rect: pg.Rect) -> None:
+        """Re-upload only `rect` of a surface that was drawn onto."""
+        texture = self._textures.get(surface)
+        if texture is not None:
+            texture.update(surface.subsurface(rect), rect)
+
+    def begin_frame(self) -> None:
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self.screen.fill((0, 0, 0, 0))
+
+    def present(self, rects: list[pg.Rect] | None = None) -> None:
+        self._ui_layer.update(self.screen)
+        self.renderer.blit(self._ui_layer, self.screen.get_rect())
+        self.renderer.present()
+
+    def close(self) -> None:
+        return
+
+
+class PipelineCanvas(WorldCanvas):
+    """One frame of the threaded backend: recorded world blits plus the UI layer."""
+    backend: "ThreadedBackend"
+    world: list[tuple[pg.Surface, pg.Rect | tuple[int, int]]]
+
+    def blit_world(self, blits: BlitSequence) -> None:
+        self.world.extend(blits)
+
+    def composite(self, target: pg.Surface) -> None:
+        target.fill((0, 0, 0))
+        target.blits(self.world, False)
+        target.blit(self, (0, 0))
+
+    def copy(self) -> pg.Surface:
+        snapshot = pg.Surface(self.get_size()).convert()
+        self.composite(snapshot)
+        return snapshot
+
+
+class ThreadedBackend:
+    # Each canvas is a fresh frame, there is nothing to update partially
+    supports_partial_updates = False
+
+    def __init__(self, size: tuple[int, int]):
+        self._display = pg.display.set_mode(size)
+
+        # Two canvases: the main thread records into one while the render
+        # thread composites the other
+        self._canvases = [PipelineCanvas(size, pg.SRCALPHA) for _ in range(2)]
+        for canvas in self._canvases:
+            canvas.backend = self
+            canvas.world = []
+        self._current = 0
+        self.screen: PipelineCanvas = self._canvases[0]
+
+        # Guarded by _cond: the canvas waiting for the render thread and the
+        # one it is compositing right now
+        self._pending: PipelineCanvas | None = None
+        self._rendering: PipelineCanvas | None = None
+        self._cond = threading.Condition()
+        self._closing = False
+        self._thread = threading.Thread(
+            target=self._render_loop, name="RenderThread", daemon=True)
+        self._thread.start()
+
+    def begin_frame(self) -> None:
+        # The canvas we are about to reuse was handed off two frames ago;
+        # make sure the render thread is done with it.
+        with self._cond:
+            while self.screen is self._pending or self.screen is self._rendering:
+                self._cond.wait()
+        self.screen.world.clear()
+        self.screen.fill((0, 0, 0, 0))
+
+    def wait_idle(self) -> None:
+        """Block until every handed-off frame has been presented."""
+        with self._cond:
+            while self._pending is not None or self._rendering is not None:
+                self._cond.wait()
+
+    def present(self, rects: list[pg.Rect] | None = None) -> None:
+        with self._cond:
+            # Never queue more than one frame ahead of the render thread
+            while self._pending is not None:
+                self._cond.wait()
+            self._pending = self.screen
+            self._cond.notify_all()
+        self._current = 1 - self._current
+        self.screen = self._canvases[self._current]
+
+    def _render_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closing:
+                    self._cond.wait()
+                if self._closing:
+                    return
+                canvas, self._pending = self._pending, None
+                self._rendering = canvas
+                self._cond.notify_all()
+
+            canvas.composite(self._display)
+            pg.display.flip()
+
+            with self._cond:
+                self._rendering = None
+                self._cond.notify_all()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+
+
+def create_backend(size: tuple[int, int]) -> RenderBackend:
+    if GameSettings.RENDER_BACKEND == "texture":
+        try:
+            return TextureBackend(size)
+        except (ImportError, pg.error) as e:
+            Logger.warning(f"Texture backend unavailable, using surfaces: {e}")
+    elif GameSettings.RENDER_BACKEND == "threaded":
+        return ThreadedBackend(size)
+    return SurfaceBackend(size)
+
+
+# Sprite frames and map chunks resized for a ReducedCanvas, dropped with their source
+_scaled: weakref.WeakKeyDictionary[pg.Surface, dict[tuple[float, bool], pg.Surface]] = weakref.WeakKeyDictionary()
+
+
+def scaled_surface(surface: pg.Surface, scale: float, smooth: bool) -> pg.Surface:
+    variants = _scaled.setdefault(surface, {})
+    key = (scale, smooth)
+    if key not in variants:
+        w, h = surface.get_size()
+        variants[key] = resample_surface(
+            surface, (max(1, round(w * scale)), max(1, round(h * scale))), smooth)
+    return variants[key]
+
+
+def reduced_canvas(screen: pg.Surface, scale: float, smooth: bool,
+                   canvas: ReducedCanvas | None = None) -> ReducedCanvas:
+    """A ReducedCanvas for `screen`, reusing `canvas` when it still fits."""
+    w, h = screen.get_size()
+    size = (round(w * scale), round(h * scale))
+    if canvas is None or canvas.get_size() != size:
+        canvas = ReducedCanvas(size, 0, screen)
+        canvas.logical_size = (w, h)
+    canvas.scale, canvas.smooth = scale, smooth
+    return canvas
+
+
+def begin_world_edits(screen: pg.Surface) -> None:
+    """
+    Call once before a batch of world_surface_edited(): under the threaded
+    backend it waits until the render thread has presented every frame
+    handed to it, so no world surface is being read any more. That stalls
+    the pipeline for one frame, which is why it is done per batch.
+    """
+    if isinstance(screen, PipelineCanvas):
+        screen.backend.wait_idle()
+
+
+@contextmanager
+def world_surface_edited(screen: pg.Surface, surface: pg.Surface, rect: pg.Rect) -> Iterator[pg.Surface]:
+    """
+    Draw onto `rect` of a world surface that blit_world may already have
+    seen (after begin_world_edits()): afterwards refreshes that region of
+    its texture and drops its resized copies.
+    """
+    yield surface
+    if isinstance(screen, TextureCanvas):
+        screen.backend.update_region(surface, rect)
+    _scaled.pop(surface, None)
+
+
+def view_size(screen: pg.Surface) -> tuple[int, int]:
+    """Screen-space size the world is drawn for."""
+    if isinstance(screen, ReducedCanvas):
+        return screen.logical_size
+    return screen.get_size()
+
+
+def blit_world(screen: pg.Surface, blits: BlitSequence) -> None:
+    """Blit static world surfaces (map chunks, sprite frames) through the active backend."""
+    if isinstance(screen, WorldCanvas):
+        screen.blit_world(blits)
+    else:
+        screen.blits(blits, False)
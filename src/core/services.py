@@ -1,6 +1,8 @@
-from .managers import InputManager, ResourceManager, SceneManager, SoundManager
+from .managers import InputManager, ResourceManager, SceneManager, SoundManager, QualityManager, DebugDraw
 
 input_manager = InputManager()
 resource_manager = ResourceManager()
 scene_manager = SceneManager()
 sound_manager = SoundManager()
+quality_manager = QualityManager()
+debug_draw = DebugDraw(quality_manager)
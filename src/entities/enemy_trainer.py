@@ -6,9 +6,10 @@ from typing import override
 
 from src.utils.definition import Monster
 from .entity import Entity
-from src.sprites import Sprite
+from src.sprites import Sprite, RenderQueue, RenderLayer
 from src.core import GameManager
-from src.core.services import input_manager, scene_manager
+from src.core.managers import DebugMode
+from src.core.services import input_manager, scene_manager, debug_draw
 from src.utils import GameSettings, Direction, Position, PositionCamera
 
 
@@ -97,21 +98,16 @@ class EnemyTrainer(Entity):
         self.animation.update_pos(self.position)
 
     @override
-    def draw(self, screen: pg.Surface, camera: PositionCamera) -> None:
-        super().draw(screen, camera)
+    def submit(self, queue: RenderQueue, camera: PositionCamera, alpha: float = 1.0) -> None:
+        super().submit(queue, camera, alpha)
 
         if self.detected:
-            self.warning_sign.draw(screen, camera)
-
-        # if GameSettings.DRAW_HITBOXES:
-            # los_rect = self._get_los_rect()
-            # if los_rect is not None:
-            # pg.draw.rect(
-            # screen,
-            # (255, 255, 0),
-            # camera.transform_rect(los_rect),
-            # 1
-            # )
+            self.warning_sign.submit(queue, camera, RenderLayer.EFFECTS)
+
+        if debug_draw.shows(DebugMode.WORLD):
+            los_rect = self._get_los_rect()
+            if los_rect is not None:
+                debug_draw.rect((255, 255, 0), los_rect, mode=DebugMode.WORLD)
 
     def _set_direction(self, direction: Direction) -> None:
         self.direction = direction
@@ -1,15 +1,17 @@
 from __future__ import annotations
 import pygame as pg
 from typing import override
-from src.sprites import Animation
+from src.sprites import Animation, RenderQueue
 from src.utils import Position, PositionCamera, Direction, GameSettings
 from src.core import GameManager
+from src.core.services import debug_draw
 
 
 class Entity:
     animation: Animation
     direction: Direction
     position: Position
+    prev_position: Position     # Position at the start of the current tick
     game_manager: GameManager
 
     def __init__(self, x: float, y: float, game_manager: GameManager) -> None:
@@ -20,6 +22,7 @@ class Entity:
         )
 
         self.position = Position(x, y)
+        self.prev_position = self.position.copy()
         self.direction = Direction.DOWN
         self.animation.update_pos(self.position)
         self.game_manager = game_manager
@@ -33,9 +36,30 @@ class Entity:
             self.animation.accumulator = 0
 
     def draw(self, screen: pg.Surface, camera: PositionCamera) -> None:
-        self.animation.draw(screen, camera)
-        if GameSettings.DRAW_HITBOXES:
-            self.animation.draw_hitbox(screen, camera)
+        queue = RenderQueue()
+        self.submit(queue, camera)
+        queue.flush(screen)
+
+    def submit(self, queue: RenderQueue, camera: PositionCamera, alpha: float = 1.0) -> None:
+        """Queue this entity's draw calls; GameScene flushes the whole world at once."""
+        rect = self.render_rect(alpha)
+        self.animation.submit(queue, camera, rect=rect)
+        debug_draw.rect((255, 0, 0), rect)
+
+    def snapshot_position(self) -> None:
+        """Call before each fixed update so rendering can interpolate from here."""
+        self.prev_position = self.position.copy()
+
+    def render_rect(self, alpha: float) -> pg.Rect:
+        """The animation rect placed `alpha` of the way from prev_position to position."""
+        prev, cur = self.prev_position, self.position
+        rect = self.animation.rect.copy()
+        # Teleports and map switches snap instead of sliding across the map
+        if abs(cur.x - prev.x) + abs(cur.y - prev.y) > GameSettings.TILE_SIZE * 2:
+            alpha = 1.0
+        rect.topleft = (prev.x + (cur.x - prev.x) * alpha,
+                        prev.y + (cur.y - prev.y) * alpha)
+        return rect
 
     @staticmethod
     def _snap_to_grid(value: float) -> int:
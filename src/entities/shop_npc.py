@@ -5,9 +5,10 @@ from typing import override
 
 from src.entities.entity import Entity
 from src.utils import GameSettings, Direction, Position, PositionCamera
-from src.sprites import Animation, Sprite
+from src.sprites import Animation, Sprite, RenderQueue, RenderLayer
 from src.core import GameManager
-from src.core.services import input_manager
+from src.core.managers import DebugMode
+from src.core.services import input_manager, debug_draw
 
 
 @dataclass
@@ -88,16 +89,14 @@ class ShopNPC(Entity):
         self.animation.update_pos(self.position)
 
     @override
-    def draw(self, screen: pg.Surface, camera: PositionCamera) -> None:
-        self.animation.draw(screen, camera)
+    def submit(self, queue: RenderQueue, camera: PositionCamera, alpha: float = 1.0) -> None:
+        self.animation.submit(queue, camera, rect=self.render_rect(alpha))
 
         if self.detected:
-            self.warning_sign.draw(screen, camera)
+            self.warning_sign.submit(queue, camera, RenderLayer.EFFECTS)
 
-        """if GameSettings.DRAW_HITBOXES:
-            los_rect = self._get_los_rect()
-            pg.draw.rect(screen, (255, 255, 0),
-                         camera.transform_rect(los_rect), 1)"""
+        if debug_draw.shows(DebugMode.WORLD):
+            debug_draw.rect((255, 255, 0), self._get_los_rect(), mode=DebugMode.WORLD)
 
     def _set_direction(self, direction: Direction) -> None:
         self.direction = direction
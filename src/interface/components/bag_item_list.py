@@ -1,6 +1,6 @@
 import pygame as pg
 
-from src.core.services import input_manager
+from src.core.services import input_manager, resource_manager
 from src.interface.components.component import UIComponent
 from src.interface.components.bag_item_row import BagItemRow
 
@@ -18,7 +18,7 @@ class BagItemList(UIComponent):
         self.scroll = 0
         self.max_scroll = 0
 
-        self.empty_font = pg.font.SysFont("arial", 20)
+        self.empty_font = resource_manager.get_sys_font("arial", 20)
 
     def set_items(self, items) -> None:
         self.rows = []  # start fresh
@@ -77,8 +77,8 @@ class BagItemList(UIComponent):
         pg.draw.rect(screen, (180, 180, 180), self.rect, 2, border_radius=8)
 
         if not self.rows:
-            message = self.empty_font.render(
-                "Nothing in the bag", True, (220, 220, 220))
+            message = resource_manager.render_text(
+                self.empty_font, "Nothing in the bag", (220, 220, 220))
             screen.blit(message, message.get_rect(center=self.rect.center))
             return
 
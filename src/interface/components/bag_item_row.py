@@ -19,8 +19,8 @@ class BagItemRow(UIComponent):
         self.name_surface = None
         self.count_surface = None
 
-        self.name_font = pg.font.SysFont("arial", 22)
-        self.count_font = pg.font.SysFont("arial", 18)
+        self.name_font = resource_manager.get_sys_font("arial", 22)
+        self.count_font = resource_manager.get_sys_font("arial", 18)
 
         # Monster mode
         self.monster_icon_size = 36
@@ -28,8 +28,8 @@ class BagItemRow(UIComponent):
         self.monster_name_surface = None
         self.monster_count_surface = None
 
-        self.monster_name_font = pg.font.SysFont("arial", 22)
-        self.monster_count_font = pg.font.SysFont("arial", 18)
+        self.monster_name_font = resource_manager.get_sys_font("arial", 22)
+        self.monster_count_font = resource_manager.get_sys_font("arial", 18)
 
         # Default mode
         self.mode = "item"
@@ -48,10 +48,10 @@ class BagItemRow(UIComponent):
             self.icon_surface = pg.Surface(
                 (self.icon_size, self.icon_size), pg.SRCALPHA)
 
-        self.name_surface = self.name_font.render(
-            name or "-", True, (255, 255, 255))
-        self.count_surface = self.count_font.render(
-            f"x{count}", True, (210, 210, 210))
+        self.name_surface = resource_manager.render_text(
+            self.name_font, name or "-", (255, 255, 255))
+        self.count_surface = resource_manager.render_text(
+            self.count_font, f"x{count}", (210, 210, 210))
 
     def set_monsters(self, monster_path: str, name: str, count: int) -> None:
         self.mode = "monster"
@@ -66,10 +66,10 @@ class BagItemRow(UIComponent):
                 (self.monster_icon_size, self.monster_icon_size), pg.SRCALPHA
             )
 
-        self.monster_name_surface = self.monster_name_font.render(
-            name or "-", True, (255, 255, 255))
-        self.monster_count_surface = self.monster_count_font.render(
-            f"x{count}", True, (210, 210, 210))
+        self.monster_name_surface = resource_manager.render_text(
+            self.monster_name_font, name or "-", (255, 255, 255))
+        self.monster_count_surface = resource_manager.render_text(
+            self.monster_count_font, f"x{count}", (210, 210, 210))
 
     def update(self, dt: float) -> None:
         del dt
@@ -0,0 +1,105 @@
+import pygame as pg
+from collections import deque
+
+from src.core.managers.network_stats import NetworkStats, HISTORY_LENGTH
+from src.core.services import resource_manager, quality_manager
+from src.interface.components.component import UIComponent
+
+
+class NetworkStatsOverlay(UIComponent):
+    """Small debug panel with live graphs of network traffic and frame time."""
+
+    GRAPH_W = 200
+    GRAPH_H = 34
+    ROW_GAP = 18
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+        self.visible = False
+        self.stats: NetworkStats | None = None
+
+        self.frame_times: deque[float] = deque(maxlen=HISTORY_LENGTH)
+        self._frames_seen = quality_manager.frames
+        self.font = resource_manager.get_sys_font("arial", 14)
+
+    def set_stats(self, stats: NetworkStats | None) -> None:
+        self.stats = stats
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def update(self, dt: float) -> None:
+        # dt is the fixed simulation step; the graph wants what frames really
+        # took, one point per frame however many ticks it ran
+        if quality_manager.frames != self._frames_seen:
+            self._frames_seen = quality_manager.frames
+            self.frame_times.append(quality_manager.last_frame_ms)
+        if self.stats is not None:
+            self.stats.sample()
+
+    def _graphs(self) -> list[tuple[str, list[float], str, tuple[int, int, int]]]:
+        frame = list(self.frame_times)
+        graphs = [("frame", frame, f"{frame[-1]:.1f} ms" if frame else "-",
+                   (255, 255, 255))]
+        if self.stats is None:
+            return graphs
+
+        snap = self.stats.snapshot()
+        hist = self.stats.history()
+        rtt = snap["rtt_last_ms"]
+        age = snap["snapshot_age"]
+        graphs += [
+            ("rtt", hist["rtt_ms"],
+             f"{rtt:.0f} ms" if rtt is not None else "-", (120, 220, 120)),
+            ("req/s", hist["requests_per_sec"],
+             f"{snap['requests_per_sec']:.0f}", (120, 180, 255)),
+            ("out B/s", hist["bytes_sent_per_sec"],
+             f"{snap['bytes_sent_per_sec']:.0f}", (255, 200, 100)),
+            ("in B/s", hist["bytes_received_per_sec"],
+             f"{snap['bytes_received_per_sec']:.0f}", (255, 150, 200)),
+            ("snap age", hist["snapshot_age_ms"],
+             f"{age * 1000:.0f} ms" if age is not None else "-", (220, 120, 120)),
+        ]
+        return graphs
+
+    def _draw_graph(self, screen: pg.Surface, rect: pg.Rect,
+                    values: list[float], color: tuple[int, int, int]) -> None:
+        pg.draw.rect(screen, (20, 20, 20), rect)
+        pg.draw.rect(screen, (90, 90, 90), rect, 1)
+        if len(values) < 2:
+            return
+        peak = max(values) or 1.0
+        step = rect.width / (HISTORY_LENGTH - 1)
+        points = [
+            (rect.x + i * step,
+             rect.bottom - 1 - (v / peak) * (rect.height - 2))
+            for i, v in enumerate(values)
+        ]
+        pg.draw.lines(screen, color, False, points)
+
+    def draw(self, screen: pg.Surface) -> None:
+        if not self.visible:
+            return
+
+        graphs = self._graphs()
+        row_h = self.GRAPH_H + self.ROW_GAP
+        panel = pg.Rect(self.x, self.y, self.GRAPH_W + 20,
+                        len(graphs) * row_h + 30)
+        pg.draw.rect(screen, (40, 40, 40), panel)
+        pg.draw.rect(screen, (200, 200, 200), panel, 2)
+
+        y = self.y + 8
+        for label, values, current, color in graphs:
+            text = resource_manager.render_text(self.font, f"{label}: {current}", color)
+            screen.blit(text, (self.x + 10, y))
+            graph_rect = pg.Rect(self.x + 10, y + 16, self.GRAPH_W, self.GRAPH_H)
+            self._draw_graph(screen, graph_rect, values, color)
+            y += row_h
+
+        if self.stats is not None:
+            snap = self.stats.snapshot()
+            footer = resource_manager.render_text(
+                self.font, f"errors {snap['errors']}  timeouts {snap['timeouts']}",
+                (220, 220, 220))
+            screen.blit(footer, (self.x + 10, y + 2))
@@ -1,5 +1,5 @@
 import pygame as pg
-from src.core.services import input_manager
+from src.core.services import input_manager, resource_manager
 from src.interface.components.component import UIComponent
 from src.interface.components.shop_item_row import ShopItemRow
 
@@ -20,8 +20,8 @@ class ShopItemList(UIComponent):
         self.get_shop_items = lambda: []
         self.on_buy = None
 
-        self.empty_font = pg.font.SysFont("arial", 20)
-        self.font = pg.font.SysFont("arial", 14)
+        self.empty_font = resource_manager.get_sys_font("arial", 20)
+        self.font = resource_manager.get_sys_font("arial", 14)
 
     def set_provider(self, fn):
         self.get_shop_items = fn
@@ -80,8 +80,8 @@ class ShopItemList(UIComponent):
         pg.draw.rect(screen, (180, 180, 180), self.rect, 2, border_radius=8)
 
         if not self.rows:
-            message = self.empty_font.render(
-                "No stock", True, (220, 220, 220))
+            message = resource_manager.render_text(
+                self.empty_font, "No stock", (220, 220, 220))
             screen.blit(message, message.get_rect(center=self.rect.center))
             return
 
@@ -18,17 +18,17 @@ class ShopItemRow(UIComponent):
 
         # price
         self.price = 0
-        self.price_font = pg.font.SysFont("arial", 20)
+        self.price_font = resource_manager.get_sys_font("arial", 20)
         self.price_surface = None
 
         # buy area/button
         self.clickable_buy = clickable_buy
-        self.buy_label_surface = pg.font.SysFont(
-            "arial", 18).render("BUY", True, (255, 255, 255))
+        self.buy_label_surface = resource_manager.render_text(
+            resource_manager.get_sys_font("arial", 18), "BUY", (255, 255, 255))
         self.buy_rect = None  # computed in draw
         self.on_buy = None
 
-        self.name_font = pg.font.SysFont("arial", 22)
+        self.name_font = resource_manager.get_sys_font("arial", 22)
 
         # item data
         self.count = 1
@@ -47,11 +47,11 @@ class ShopItemRow(UIComponent):
             self.icon_surface = pg.Surface(
                 (self.icon_size, self.icon_size), pg.SRCALPHA)
 
-        self.name_surface = self.name_font.render(
-            name or "-", True, (255, 255, 255))
+        self.name_surface = resource_manager.render_text(
+            self.name_font, name or "-", (255, 255, 255))
         self.price = price or 0
-        self.price_surface = self.price_font.render(
-            f"{self.price}G", True, (220, 220, 0))
+        self.price_surface = resource_manager.render_text(
+            self.price_font, f"{self.price}G", (220, 220, 0))
         self.count = count
         self.item_data = {"sprite_path": icon_path, "name": name,
                           "price": price, "count": count}
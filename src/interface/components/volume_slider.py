@@ -28,6 +28,12 @@ class VolumeSlider(UIComponent):
         self.slider_handle_x = x + int(GameSettings.AUDIO_VOLUME * width)
         self.dragging = False
 
+    @property
+    def bounds(self) -> pg.Rect:
+        """Everything draw() can touch, handle included."""
+        r = self.slider_handle_radius
+        return self.slider_rect.inflate(r * 2 + 2, r * 2 + 2)
+
     def _update_volume(self, volume: float):
         """Update the volume setting and apply it to the sound manager."""
         volume = max(0.0, min(1.0, volume))
@@ -1 +1,2 @@
-from .map import Map
\ No newline at end of file
+from .map import Map
+from .encounter_zone import EncounterZone
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Encounter zones come from tile layers: "PokemonBush", or any layer with the
+Tiled property "encounter" = true. Its tiles make up the zone, except for the
+Tiled gids listed in the layer's optional "ignore_gids" property, e.g. "1, 109"
+for ground tiles painted on the layer. An optional "wild_monsters" property
+weights what appears there, e.g. "Pikachu: 3, Gengar: 1"; without it every
+wild monster is equally likely.
+"""
+from dataclasses import dataclass
+
+import pytmx
+
+from src.utils import AliasTable, Logger
+
+ENCOUNTER_LAYERS = ("pokemonbush",)
+
+
+@dataclass(frozen=True)
+class EncounterZone:
+    name: str                           # Layer the zone comes from
+    monsters: AliasTable[str] | None    # None: any wild monster, equally likely
+
+
+def is_encounter_layer(layer: pytmx.TiledTileLayer) -> bool:
+    return (layer.name.lower() in ENCOUNTER_LAYERS
+            or bool(layer.properties.get("encounter", False)))
+
+
+def encounter_zone_for(layer: pytmx.TiledTileLayer) -> EncounterZone:
+    return EncounterZone(layer.name, _parse_monsters(layer))
+
+
+def ignored_gids(layer: pytmx.TiledTileLayer) -> set[int]:
+    """Tiled gids (as shown in Tiled, not pytmx's) that are not part of the zone."""
+    spec = layer.properties.get("ignore_gids")
+    if not spec:
+        return set()
+    gids = set()
+    for entry in str(spec).split(","):
+        try:
+            gids.add(int(entry))
+        except ValueError:
+            Logger.warning(f"Encounter layer {layer.name}: bad gid {entry.strip()!r} in ignore_gids")
+    return gids
+
+
+def _parse_monsters(layer: pytmx.TiledTileLayer) -> AliasTable[str] | None:
+    spec = layer.properties.get("wild_monsters")
+    if not spec:
+        return None
+    names, weights = [], []
+    for entry in str(spec).split(","):
+        name, _, weight = entry.partition(":")
+        try:
+            weights.append(float(weight) if weight.strip() else 1.0)
+        except ValueError:
+            Logger.warning(f"Encounter layer {layer.name}: bad weight in {entry.strip()!r}")
+            continue
+        names.append(name.strip())
+    try:
+        return AliasTable(names, weights)
+    except ValueError as e:
+        Logger.warning(f"Encounter layer {layer.name}: {e}; any wild monster can appear")
+        return None
@@ -1,8 +1,22 @@
+import numpy as np
 import pygame as pg
 import pytmx
 from src.entities.enemy_trainer import EnemyTrainer
+from src.core.render_backend import blit_world, begin_world_edits, view_size, world_surface_edited
+from .encounter_zone import EncounterZone, encounter_zone_for, ignored_gids, is_encounter_layer
 
-from src.utils import load_tmx, Position, GameSettings, PositionCamera, Teleport
+from src.utils import load_tmx, Position, GameSettings, PositionCamera, Teleport, optimize_surface
+
+CHUNK_TILES = 16    # Chunk edge length in tiles
+# Layers that are genuinely transparent; they and every layer above them are
+# baked separately from the opaque ground. A Tiled layer property
+# "overlay" = true marks extra layers.
+OVERLAY_LAYERS = ("decorative", "house")
+
+# One tile of the map that contains an animated tile: (tile x, tile y,
+# overlay chunk?, gids of the layers baked into that chunk at this tile,
+# bottom to top)
+AnimatedCell = tuple[int, int, bool, tuple[int, ...]]
 
 
 class Map:
@@ -13,8 +27,27 @@ class Map:
     spawn: Position
     teleporters: list[Teleport]
     # Rendering Properties
-    _surface: pg.Surface
-    _collision_map: list[pg.Rect]
+    _base_chunks: dict[tuple[int, int], pg.Surface]
+    _overlay_chunks: dict[tuple[int, int], pg.Surface]
+    _chunk_px: int
+    _chunk_cols: int
+    _chunk_rows: int
+    _collision_grid: bytearray     # One byte per tile, row-major: 1 where a collision layer has a tile
+    _encounter_zones: list[EncounterZone]
+    _encounter_grid: bytearray     # Same layout: index into _encounter_zones + 1, 0 outside zones
+    # Animated tiles: gid -> [(frame gid, duration ms)], the cells using
+    # them per chunk, and what each cell currently shows
+    _tile_animations: dict[int, list[tuple[int, int]]]   # Empty for static gids
+    _animated_cells: dict[tuple[int, int], list[AnimatedCell]]
+    _cell_frames: dict[tuple[int, int, bool], tuple[int, ...]]
+    _tile_images: dict[int, pg.Surface | None]
+    _anim_time: float   # Milliseconds of tile animation played
+    _anim_frames: dict[int, int]    # Animated gid -> gid of the frame it shows now
+    _anim_version: int  # Bumped whenever _anim_frames changes
+    _chunk_versions: dict[tuple[int, int], int]     # _anim_version each chunk was re-baked at
+    # Minimap Properties
+    _minimap: pg.Surface | None
+    _minimap_scaled: dict[tuple[int, int], pg.Surface]
 
     def __init__(self, path: str, tp: list[Teleport], spawn: Position):
         self.path_name = path
@@ -22,99 +55,323 @@ class Map:
         self.spawn = spawn
         self.teleporters = tp
 
-        pixel_w = self.tmxdata.width * GameSettings.TILE_SIZE
-        pixel_h = self.tmxdata.height * GameSettings.TILE_SIZE
+        # The map is baked into fixed-size chunks so drawing only has to
+        # touch the chunks under the camera, whatever the map size.
+        self._chunk_px = CHUNK_TILES * GameSettings.TILE_SIZE
+        self._chunk_cols = -(-self.tmxdata.width // CHUNK_TILES)
+        self._chunk_rows = -(-self.tmxdata.height // CHUNK_TILES)
+        self._base_chunks = {}
+        self._overlay_chunks = {}
+        self._tile_animations = {}
+        self._animated_cells = {}
+        self._cell_frames = {}
+        self._tile_images = {}
+        self._anim_time = 0.0
+        self._anim_frames = {}
+        self._anim_version = 0
+        self._chunk_versions = {}
+        self._render_all_layers()
+        self._collision_grid = self._create_collision_grid()
+        self._encounter_zones, self._encounter_grid = self._create_encounter_index()
+        self._minimap = None
+        self._minimap_scaled = {}
 
-        self._surface = pg.Surface((pixel_w, pixel_h), pg.SRCALPHA)
-        self._render_all_layers(self._surface)
-        self._collision_map = self._create_collision_map()
+    def build_minimap(self) -> pg.Surface:
+        """One pixel per tile, colored by the topmost non-empty layer's minimap_color."""
+        if self._minimap is not None:
+            return self._minimap
 
-    def build_minimap(self):
         map_w = self.tmxdata.width
         map_h = self.tmxdata.height
-
-        mini = pg.Surface((map_w, map_h))
         default_color = (0, 0, 0)  # fallback if no property
 
-        # Fill initially
-        mini.fill(default_color)
+        rgb = np.zeros((map_h, map_w, 3), dtype=np.uint8)
+        covered = np.zeros((map_h, map_w), dtype=bool)
 
-        # Get all visible tile layers
+        # Go from topmost layer down; the first non-empty tile wins
         layers = [layer for layer in self.tmxdata.visible_layers
                   if isinstance(layer, pytmx.TiledTileLayer)]
+        for layer in reversed(layers):
+            gids = np.asarray(layer.data)
+            hit = (gids != 0) & ~covered
+            if not hit.any():
+                continue
+            rgb[hit] = self._minimap_color(layer, default_color)
+            covered |= hit
 
-        for y in range(map_h):
-            for x in range(map_w):
-                rgb_color = default_color
-
-                # Go from topmost layer down
-                for layer in reversed(layers):
-                    gid = layer.data[y][x]
-                    if gid != 0:
-                        # Check if the layer has a minimap_color property
-                        if "minimap_color" in layer.properties:
-                            color = layer.properties["minimap_color"]
-                            r = int(color[3:5], 16)
-                            g = int(color[5:7], 16)
-                            b = int(color[7:9], 16)
-                            rgb_color = (r, g, b)
-                        else:
-                            color = default_color
-                        break  # stop at the first visible tile
-
-                mini.set_at((x, y), rgb_color)
-
-        return mini
+        # surfarray is indexed [x][y]
+        self._minimap = pg.surfarray.make_surface(rgb.transpose(1, 0, 2))
+        return self._minimap
+
+    def get_minimap(self, size: tuple[int, int]) -> pg.Surface:
+        """The minimap scaled to `size`, built and scaled once per map."""
+        if size not in self._minimap_scaled:
+            scaled = pg.transform.scale(self.build_minimap(), size)
+            self._minimap_scaled[size] = optimize_surface(scaled)
+        return self._minimap_scaled[size]
+
+    @staticmethod
+    def _minimap_color(layer: pytmx.TiledTileLayer,
+                       default: tuple[int, int, int]) -> tuple[int, int, int]:
+        # Tiled stores colors as #AARRGGBB
+        color = layer.properties.get("minimap_color")
+        if not color:
+            return default
+        return int(color[3:5], 16), int(color[5:7], 16), int(color[7:9], 16)
+
+    @property
+    def pixel_size(self) -> tuple[int, int]:
+        return (self.tmxdata.width * GameSettings.TILE_SIZE,
+                self.tmxdata.height * GameSettings.TILE_SIZE)
 
     def update(self, dt: float):
-        return
+        # Only the clock advances here; draw() re-bakes the visible
+        # animated tiles whose frame changed.
+        if not self._animated_cells:
+            return
+        self._anim_time += dt * 1000
+        frames = {gid: self._frame_gid(gid, self._anim_time) for gid in self._anim_frames}
+        if frames != self._anim_frames:
+            self._anim_frames = frames
+            self._anim_version += 1
 
     def draw(self, screen: pg.Surface, camera: PositionCamera):
-        screen.blit(self._surface, camera.transform_position(Position(0, 0)))
+        view_w, view_h = view_size(screen)
+        size = self._chunk_px
+        first_cx = max(0, camera.x // size)
+        first_cy = max(0, camera.y // size)
+        last_cx = min(self._chunk_cols - 1, (camera.x + view_w - 1) // size)
+        last_cy = min(self._chunk_rows - 1, (camera.y + view_h - 1) // size)
+
+        visible = [
+            (cx, cy)
+            for cy in range(first_cy, last_cy + 1)
+            for cx in range(first_cx, last_cx + 1)
+        ]
+        stale = [key for key in visible
+                 if key in self._animated_cells and self._chunk_versions[key] != self._anim_version]
+        if stale:
+            begin_world_edits(screen)
+        for key in stale:
+            self._advance_animated_cells(screen, key)
+            self._chunk_versions[key] = self._anim_version
+        blit_world(screen, [
+            (self._base_chunks[key], (key[0] * size - camera.x, key[1] * size - camera.y))
+            for key in visible
+        ])
+        blit_world(screen, [
+            (self._overlay_chunks[key], (key[0] * size - camera.x, key[1] * size - camera.y))
+            for key in visible if key in self._overlay_chunks
+        ])
 
-        '''if GameSettings.DRAW_HITBOXES:
-            for rect in self._collision_map:
-                pg.draw.rect(screen, (255, 0, 0),
-                             camera.transform_rect(rect), 1)'''
+    def collision_debug_shapes(self) -> list[tuple[tuple[int, int, int], pg.Rect, int]]:
+        """Collision tiles as outlines for the debug layer's static shapes."""
+        tile = GameSettings.TILE_SIZE
+        width = self.tmxdata.width
+        return [((255, 0, 0), pg.Rect(i % width * tile, i // width * tile, tile, tile), 1)
+                for i, blocked in enumerate(self._collision_grid) if blocked]
 
     def check_collision(self, rect: pg.Rect) -> bool:
-        for collision_rect in self._collision_map:
-            if rect.colliderect(collision_rect):
+        """Whether `rect` overlaps a collision tile: only the tiles under it are looked at."""
+        span = self._tile_span(rect)
+        if span is None:
+            return False
+        first_col, first_row, last_col, last_row = span
+        width = self.tmxdata.width
+        grid = self._collision_grid
+        for row in range(first_row, last_row + 1):
+            start = row * width
+            if grid.find(1, start + first_col, start + last_col + 1) >= 0:
                 return True
         return False
 
-    def _render_all_layers(self, target: pg.Surface) -> None:
+    def _tile_span(self, rect: pg.Rect) -> tuple[int, int, int, int] | None:
+        """(first_col, first_row, last_col, last_row) of the map tiles under `rect`, None if it covers none."""
+        if rect.width <= 0 or rect.height <= 0:
+            return None
+        tile = GameSettings.TILE_SIZE
+        first_col = max(0, rect.left // tile)
+        last_col = min(self.tmxdata.width - 1, (rect.right - 1) // tile)
+        first_row = max(0, rect.top // tile)
+        last_row = min(self.tmxdata.height - 1, (rect.bottom - 1) // tile)
+        if first_col > last_col or first_row > last_row:
+            return None
+        return first_col, first_row, last_col, last_row
+
+    def _chunk_size(self, cx: int, cy: int) -> tuple[int, int]:
+        tiles_w = min(CHUNK_TILES, self.tmxdata.width - cx * CHUNK_TILES)
+        tiles_h = min(CHUNK_TILES, self.tmxdata.height - cy * CHUNK_TILES)
+        return tiles_w * GameSettings.TILE_SIZE, tiles_h * GameSettings.TILE_SIZE
+
+    def _is_overlay_layer(self, layer: pytmx.TiledTileLayer) -> bool:
+        return (layer.name.lower() in OVERLAY_LAYERS
+                or bool(layer.properties.get("overlay", False)))
+
+    def _render_all_layers(self) -> None:
+        # Ground chunks have no alpha channel: every chunk exists and the
+        # opaque blit is cheap. Overlay chunks only exist where they have tiles.
+        for cy in range(self._chunk_rows):
+            for cx in range(self._chunk_cols):
+                self._base_chunks[(cx, cy)] = pg.Surface(self._chunk_size(cx, cy))
+
+        # Animated tiles are baked with their first frame; the layers under
+        # and over them are remembered so the cell can be re-baked later.
+        animated = any(props.get("frames") for props in self.tmxdata.tile_properties.values())
+        stacks: dict[tuple[int, int, bool], list[int]] | None = {} if animated else None
+        in_overlay = False
         for layer in self.tmxdata.visible_layers:
             if isinstance(layer, pytmx.TiledTileLayer):
-                self._render_tile_layer(target, layer)
+                in_overlay = in_overlay or self._is_overlay_layer(layer)
+                self._render_tile_layer(layer, in_overlay, stacks)
+
+        self._anim_frames = {
+            gid: frames[0][0] for gid, frames in self._tile_animations.items() if frames
+        }
+        for (x, y, overlay), gids in (stacks or {}).items():
+            if any(self._tile_animations.get(gid) for gid in gids):
+                key = (x // CHUNK_TILES, y // CHUNK_TILES)
+                cell = (x, y, overlay, tuple(gids))
+                self._animated_cells.setdefault(key, []).append(cell)
+                self._chunk_versions[key] = 0
+                self._cell_frames[(x, y, overlay)] = self._cell_gids(cell)
+
+        # Overlay chunks that get re-baked keep plain per-pixel alpha:
+        # a colorkeyed chunk cannot be partially cleared and redrawn.
+        animated_overlays = {
+            key for key, cells in self._animated_cells.items()
+            if any(overlay for _, _, overlay, _ in cells)
+        }
+        for key, chunk in self._base_chunks.items():
+            self._base_chunks[key] = optimize_surface(chunk)
+        for key, chunk in self._overlay_chunks.items():
+            self._overlay_chunks[key] = (
+                chunk.convert_alpha() if key in animated_overlays
+                else optimize_surface(chunk))
 
-    def _render_tile_layer(self, target: pg.Surface, layer: pytmx.TiledTileLayer) -> None:
+    def _tile_image(self, gid: int) -> pg.Surface | None:
+        """Tile image scaled to TILE_SIZE, once per gid."""
+        if gid not in self._tile_images:
+            image = self.tmxdata.get_tile_image_by_gid(gid)
+            if image is not None:
+                image = pg.transform.scale(
+                    image, (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
+            self._tile_images[gid] = image
+        return self._tile_images[gid]
+
+    def _tile_animation(self, gid: int) -> list[tuple[int, int]]:
+        """Tiled animation frames of `gid` as (frame gid, duration ms), empty if static."""
+        if gid not in self._tile_animations:
+            props = self.tmxdata.get_tile_properties_by_gid(gid) or {}
+            self._tile_animations[gid] = [
+                (frame.gid, frame.duration) for frame in props.get("frames", ())
+                if frame.duration > 0
+            ]
+        return self._tile_animations[gid]
+
+    def _frame_gid(self, gid: int, time_ms: float) -> int:
+        frames = self._tile_animations.get(gid)
+        if not frames:
+            return gid
+        t = time_ms % sum(duration for _, duration in frames)
+        for frame_gid, duration in frames:
+            if t < duration:
+                return frame_gid
+            t -= duration
+        return frames[-1][0]
+
+    def _cell_gids(self, cell: AnimatedCell) -> tuple[int, ...]:
+        """What the cell's layers show at the current animation time."""
+        frames = self._anim_frames
+        return tuple(frames.get(gid, gid) for gid in cell[3])
+
+    def _advance_animated_cells(self, screen: pg.Surface, key: tuple[int, int]) -> None:
+        """Re-bake the animated cells of chunk `key` whose frame changed since they were drawn."""
+        tile = GameSettings.TILE_SIZE
+        for cell in self._animated_cells[key]:
+            x, y, overlay, _ = cell
+            frames = self._cell_gids(cell)
+            if self._cell_frames[(x, y, overlay)] == frames:
+                continue
+            self._cell_frames[(x, y, overlay)] = frames
+
+            chunk = (self._overlay_chunks if overlay else self._base_chunks)[key]
+            rect = pg.Rect((x % CHUNK_TILES) * tile, (y % CHUNK_TILES) * tile, tile, tile)
+            with world_surface_edited(screen, chunk, rect):
+                chunk.fill((0, 0, 0, 0) if overlay else (0, 0, 0), rect)
+                for gid in frames:
+                    image = self._tile_image(gid)
+                    if image is not None:
+                        chunk.blit(image, rect)
+
+    def _render_tile_layer(self, layer: pytmx.TiledTileLayer, overlay: bool,
+                           stacks: dict[tuple[int, int, bool], list[int]] | None) -> None:
+        target = self._overlay_chunks if overlay else self._base_chunks
         for x, y, gid in layer:
             if gid == 0:
                 continue
-            image = self.tmxdata.get_tile_image_by_gid(gid)
+            if stacks is None:
+                image = self._tile_image(gid)
+            else:
+                stacks.setdefault((x, y, overlay), []).append(gid)
+                animation = self._tile_animation(gid)
+                image = self._tile_image(animation[0][0] if animation else gid)
             if image is None:
                 continue
 
-            image = pg.transform.scale(
-                image, (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
-            target.blit(image, (x * GameSettings.TILE_SIZE,
-                        y * GameSettings.TILE_SIZE))
+            key = (x // CHUNK_TILES, y // CHUNK_TILES)
+            if key not in target:
+                target[key] = pg.Surface(self._chunk_size(*key), pg.SRCALPHA)
+            target[key].blit(image, ((x % CHUNK_TILES) * GameSettings.TILE_SIZE,
+                                     (y % CHUNK_TILES) * GameSettings.TILE_SIZE))
 
-    def _create_collision_map(self) -> list[pg.Rect]:
-        rects = []
+    def _create_collision_grid(self) -> bytearray:
+        blocked = np.zeros((self.tmxdata.height, self.tmxdata.width), dtype=bool)
         for layer in self.tmxdata.visible_layers:
             if isinstance(layer, pytmx.TiledTileLayer) and ("collision" in layer.name.lower() or "house" in layer.name.lower()):
-                for x, y, gid in layer:
-                    if gid != 0:
-                        rect = pg.Rect(
-                            x * GameSettings.TILE_SIZE,
-                            y * GameSettings.TILE_SIZE,
-                            GameSettings.TILE_SIZE,
-                            GameSettings.TILE_SIZE
-                        )
-                        rects.append(rect)
-        return rects
+                blocked |= np.asarray(layer.data) != 0
+        return bytearray(blocked.astype(np.uint8).tobytes())
+
+    def _create_encounter_index(self) -> tuple[list[EncounterZone], bytearray]:
+        zones: list[EncounterZone] = []
+        grid = np.zeros((self.tmxdata.height, self.tmxdata.width), dtype=np.uint8)
+        for layer in self.tmxdata.visible_layers:
+            if not isinstance(layer, pytmx.TiledTileLayer) or not is_encounter_layer(layer):
+                continue
+            gids = np.asarray(layer.data)
+            tiles = gids != 0
+            ignored = ignored_gids(layer)
+            for gid in np.unique(gids[tiles]):
+                gid = int(gid)
+                # pytmx renumbers gids; the property uses the ones Tiled shows
+                if (self.tmxdata.tiledgidmap.get(gid, gid) in ignored
+                        or self.tmxdata.get_tile_image_by_gid(gid) is None):
+                    tiles &= gids != gid
+            if tiles.any():
+                zones.append(encounter_zone_for(layer))
+                grid[tiles] = len(zones)    # Upper layers win where zones overlap
+        return zones, bytearray(grid.tobytes())
+
+    def encounter_zone_at(self, rect: pg.Rect) -> EncounterZone | None:
+        """The encounter zone under `rect`, looking only at the tiles it covers."""
+        span = self._tile_span(rect) if self._encounter_zones else None
+        if span is None:
+            return None
+        first_col, first_row, last_col, last_row = span
+        width = self.tmxdata.width
+        grid = self._encounter_grid
+        for row in range(first_row, last_row + 1):
+            start = row * width
+            for zone in grid[start + first_col:start + last_col + 1]:
+                if zone:
+                    return self._encounter_zones[zone - 1]
+        return None
+
+    def encounter_debug_shapes(self) -> list[tuple[tuple[int, int, int], pg.Rect, int]]:
+        """Encounter zone tiles as outlines for the debug layer's static shapes."""
+        tile = GameSettings.TILE_SIZE
+        width = self.tmxdata.width
+        return [((255, 0, 0), pg.Rect(i % width * tile, i // width * tile, tile, tile), 2)
+                for i, zone in enumerate(self._encounter_grid) if zone]
 
     def check_teleport(self, player_rect: pg.Rect) -> Teleport | None:
         for tp in self.teleporters:
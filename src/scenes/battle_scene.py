@@ -1,15 +1,17 @@
 import pygame as pg
 from src.utils.settings import GameSettings
 from src.scenes.scene import Scene
-from src.sprites import BackgroundSprite
+from src.sprites import BackgroundSprite, ParticleSystem
+from src.sprites.particles import attack_effect, impact_effect, heal_effect
 from src.utils.definition import Monster
-from src.core.services import scene_manager
+from src.core.services import scene_manager, resource_manager
 from typing import override
 from src.core import GameManager
 from src.interface.components import Button
 
 
 class BattleScene(Scene):
+    tracks_dirty_rects = True
     game_manager: GameManager | None
     enemy_trainer: "EnemyTrainer | None"
     player_monster: Monster | None
@@ -21,6 +23,7 @@ class BattleScene(Scene):
     run_button: Button
     strength_buff: int
     defense_buff: int
+    particles: ParticleSystem
 
     def __init__(self):
         super().__init__()
@@ -32,6 +35,7 @@ class BattleScene(Scene):
         self.defense_buff = 0
         self.turn_state = "player_turn"
         self.timer = 0
+        self.particles = ParticleSystem()
 
         px, py = GameSettings.SCREEN_WIDTH // 2, GameSettings.SCREEN_HEIGHT * 3 // 4
         self.background = BackgroundSprite("backgrounds/background1.png")
@@ -77,6 +81,8 @@ class BattleScene(Scene):
         if self.turn_state == "player_turn":
             self.turn_state = "player_attack_animation"
             self.timer = 1.0
+            player, enemy = self._monster_centers()
+            attack_effect(self.particles, player, enemy)
             self.attack_button.enabled = False
             self.run_button.enabled = False
             self.heal_button.enabled = False
@@ -92,9 +98,11 @@ class BattleScene(Scene):
         self.player_monster["hp"] += 20
         if self.player_monster["hp"] > self.player_monster["max_hp"]:
             self.player_monster["hp"] = self.player_monster["max_hp"]
+        heal_effect(self.particles, self._monster_centers()[0])
 
         self.turn_state = "enemy_attack_animation"
         self.timer = 1.0
+        self._enemy_attack_effect()
 
         self.attack_button.enabled = False
         self.run_button.enabled = False
@@ -111,6 +119,7 @@ class BattleScene(Scene):
         self.strength_buff += 20
         self.turn_state = "enemy_attack_animation"
         self.timer = 1.0
+        self._enemy_attack_effect()
 
         self.attack_button.enabled = True
         self.run_button.enabled = True
@@ -126,6 +135,7 @@ class BattleScene(Scene):
 
         self.turn_state = "enemy_attack_animation"
         self.timer = 1.0
+        self._enemy_attack_effect()
 
         self.defense_buff += 15  # reduce next enemy attack by 15
         # Keep turn state same, just enable buttons
@@ -198,6 +208,7 @@ class BattleScene(Scene):
         self.timer = 0
         self.strength_buff = 0
         self.defense_buff = 0
+        self.particles.clear()
 
         self.attack_button.enabled = True
         self.run_button.enabled = True
@@ -209,6 +220,7 @@ class BattleScene(Scene):
         self.heal_button.update(dt)
         self.strength_button.update(dt)
         self.defense_button.update(dt)
+        self._watch_changes()
 
         if self.turn_state == "player_attack_animation":
             self.timer -= dt
@@ -216,6 +228,7 @@ class BattleScene(Scene):
                 damage = 30 + self.strength_buff
                 self.enemy_monster["hp"] -= damage
                 self.strength_buff = 0
+                impact_effect(self.particles, self._monster_centers()[1])
                 if self.enemy_monster["hp"] <= 0:
                     self.enemy_monster["hp"] = 0
                     self.game_manager.bag.add_coins(10)
@@ -223,6 +236,7 @@ class BattleScene(Scene):
                 else:
                     self.turn_state = "enemy_attack_animation"
                     self.timer = 1.0
+                    self._enemy_attack_effect()
 
         elif self.turn_state == "enemy_attack_animation":
             self.timer -= dt
@@ -232,6 +246,7 @@ class BattleScene(Scene):
                     damage = 0
                 self.player_monster["hp"] -= damage
                 self.defense_buff = 0
+                impact_effect(self.particles, self._monster_centers()[0], (200, 90, 255))
                 if self.player_monster["hp"] <= 0:
                     self.player_monster["hp"] = 0
                     self.turn_state = "end"
@@ -255,6 +270,35 @@ class BattleScene(Scene):
             self.defense_button.enabled = self.get_item_count(
                 "Defense Potion") > 0
 
+        self.particles.update(dt)
+        particle_rect = self.particles.dirty_rect()
+        if particle_rect is not None:
+            self.mark_dirty(particle_rect)
+
+    def _monster_centers(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Screen centers of the player's and the enemy's monster, as draw() places them."""
+        player = self.player_monster["sprite"].get_rect(
+            topleft=(150, GameSettings.SCREEN_HEIGHT // 2))
+        enemy = self.enemy_monster["sprite"].get_rect(
+            topleft=(GameSettings.SCREEN_WIDTH - 150, GameSettings.SCREEN_HEIGHT // 2))
+        return player.center, enemy.center
+
+    def _enemy_attack_effect(self) -> None:
+        player, enemy = self._monster_centers()
+        attack_effect(self.particles, enemy, player, (170, 80, 255))
+
+    def _watch_changes(self) -> None:
+        for name in ("attack", "run", "heal", "strength", "defense"):
+            button: Button = getattr(self, f"{name}_button")
+            self.watch(name, button.img_button, button.hitbox)
+
+        # Monsters, HP text and the action buttons live in the lower half
+        hp = (self.player_monster["hp"] if self.player_monster else None,
+              self.enemy_monster["hp"] if self.enemy_monster else None)
+        band = pg.Rect(0, GameSettings.SCREEN_HEIGHT // 2 - 40, GameSettings.SCREEN_WIDTH,
+                       GameSettings.SCREEN_HEIGHT // 2 + 40)
+        self.watch("battle", (self.turn_state, hp), band)
+
     @override
     def draw(self, screen: pg.Surface) -> None:
         self.background.draw(screen)
@@ -264,7 +308,7 @@ class BattleScene(Scene):
         self.strength_button.draw(screen)
         self.defense_button.draw(screen)
 
-        font = pg.font.SysFont(None, 30)
+        font = resource_manager.get_sys_font(None, 30)
 
         # Player Monster
         player_sprite = self.player_monster["sprite"]
@@ -273,13 +317,13 @@ class BattleScene(Scene):
         if self.player_monster["hp"] > 0:
             screen.blit(player_sprite, player_pos)
         else:
-            fainted_text = font.render("DEAD", True, (255, 0, 0))
+            fainted_text = resource_manager.render_text(font, "DEAD", (255, 0, 0))
             screen.blit(fainted_text, player_pos)
 
         # Player Monster HP
-        player_hp_text = font.render(
-            f'HP: {self.player_monster["hp"]}/{self.player_monster["max_hp"]}',
-            True, (255, 255, 255)
+        player_hp_text = resource_manager.render_text(
+            font, f'HP: {self.player_monster["hp"]}/{self.player_monster["max_hp"]}',
+            (255, 255, 255)
         )
         screen.blit(player_hp_text, (player_pos[0], player_pos[1] - 40))
 
@@ -290,12 +334,15 @@ class BattleScene(Scene):
         if self.enemy_monster["hp"] > 0:
             screen.blit(enemy_sprite, enemy_pos)
         else:
-            fainted_text = font.render("DEAD", True, (255, 0, 0))
+            fainted_text = resource_manager.render_text(font, "DEAD", (255, 0, 0))
             screen.blit(fainted_text, enemy_pos)
 
         # Enemy monster HP above monster
-        enemy_hp_text = font.render(
-            f'HP: {self.enemy_monster["hp"]}/{self.enemy_monster["max_hp"]}',
-            True, (255, 255, 255)
+        enemy_hp_text = resource_manager.render_text(
+            font, f'HP: {self.enemy_monster["hp"]}/{self.enemy_monster["max_hp"]}',
+            (255, 255, 255)
         )
         screen.blit(enemy_hp_text, (enemy_pos[0], enemy_pos[1] - 40))
+
+        # Attack, impact and heal effects on top of everything
+        self.particles.draw(screen)
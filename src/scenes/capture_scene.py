@@ -2,12 +2,15 @@ import pygame as pg
 import random
 from src.utils.settings import GameSettings
 from src.scenes.scene import Scene
-from src.sprites import BackgroundSprite
+from src.sprites import BackgroundSprite, ParticleSystem
+from src.sprites.particles import attack_effect, impact_effect, capture_effect
 from src.utils.definition import Monster
-from src.core.services import scene_manager
+from src.core.services import scene_manager, resource_manager
 from typing import override
 from src.core import GameManager
 from src.interface.components import Button
+from src.maps import EncounterZone
+from src.utils import AliasTable, Logger
 
 # monster list
 WILD_MONSTER_TEMPLATES = {
@@ -18,10 +21,14 @@ WILD_MONSTER_TEMPLATES = {
     "Gengar": {"sprite_path": "menu_sprites/menusprite5.png", "base_hp": 90, "base_level": 8},
     "Dragonite": {"sprite_path": "menu_sprites/menusprite6.png", "base_hp": 160, "base_level": 15},
 }
+# Zones without their own table
+ANY_WILD_MONSTER = AliasTable(list(WILD_MONSTER_TEMPLATES), [1.0] * len(WILD_MONSTER_TEMPLATES))
 
 
 class CaptureScene(Scene):
+    tracks_dirty_rects = True
     game_manager: GameManager | None
+    encounter_zone: EncounterZone | None
     player_monster: Monster | None
     enemy_monster: Monster | None
     turn_state: str
@@ -32,10 +39,12 @@ class CaptureScene(Scene):
     run_button: Button
     player_sprite: pg.Surface | None
     enemy_sprite: pg.Surface | None
+    particles: ParticleSystem
 
     def __init__(self):
         super().__init__()
         self.game_manager = None
+        self.encounter_zone = None
         self.player_monster = None
         self.enemy_monster = None
         self.turn_state = "player_turn"
@@ -43,6 +52,7 @@ class CaptureScene(Scene):
         self.capture_attempt_text = ""
         self.player_sprite = None
         self.enemy_sprite = None
+        self.particles = ParticleSystem()
 
         px, py = GameSettings.SCREEN_WIDTH // 2, GameSettings.SCREEN_HEIGHT * 3 // 4
         self.background = BackgroundSprite("backgrounds/background1.png")
@@ -82,8 +92,17 @@ class CaptureScene(Scene):
             "sprite_path": sprite_path
         }
 
+    def set_encounter_zone(self, zone: EncounterZone | None) -> None:
+        """The zone the next wild monster comes from; call before changing to this scene."""
+        self.encounter_zone = zone
+
     def _set_wild_monster(self) -> None:
-        monster_name = random.choice(list(WILD_MONSTER_TEMPLATES.keys()))
+        zone = self.encounter_zone
+        table = zone.monsters if zone is not None and zone.monsters is not None else ANY_WILD_MONSTER
+        monster_name = table.sample()
+        if monster_name not in WILD_MONSTER_TEMPLATES:
+            Logger.warning(f"Unknown wild monster {monster_name!r} in encounter zone {zone.name}")
+            monster_name = ANY_WILD_MONSTER.sample()
         self.enemy_monster = self._create_monster(monster_name)
 
         self.enemy_sprite = pg.image.load(
@@ -95,6 +114,8 @@ class CaptureScene(Scene):
             self.turn_state = "player_attack_animation"
             self.timer = 1.0
             self.capture_attempt_text = f"{self.player_monster['name']} attacked!"
+            player, enemy = self._monster_centers()
+            attack_effect(self.particles, player, enemy)
             self.attack_button.enabled = False
             self.capture_button.enabled = False
             self.run_button.enabled = False
@@ -108,7 +129,9 @@ class CaptureScene(Scene):
                 0.1, min(1.0, 1.0 - (current_hp / max_hp) * 0.9))
             capture_chance = 25 * capture_multiplier
 
-            if random.random() * 100 < capture_chance:
+            captured = random.random() * 100 < capture_chance
+            capture_effect(self.particles, self._monster_centers()[1], captured)
+            if captured:
                 self.capture_attempt_text = f"Success! {self.enemy_monster['name']} was captured!"
 
                 captured_monster = {
@@ -123,6 +146,8 @@ class CaptureScene(Scene):
             else:
                 self.capture_attempt_text = f"Aww! {self.enemy_monster['name']} broke free!"
                 self.turn_state = "enemy_attack_animation"
+                # Strikes back once the capture burst is over
+                self._enemy_attack_effect(delay=0.6)
 
             self.attack_button.enabled = False
             self.capture_button.enabled = False
@@ -153,6 +178,7 @@ class CaptureScene(Scene):
             self.turn_state = "player_turn"
             self.timer = 0
             self.capture_attempt_text = f"A wild {self.enemy_monster['name']} appeared!"
+            self.particles.clear()
 
             self.attack_button.enabled = True
             self.capture_button.enabled = True
@@ -163,11 +189,13 @@ class CaptureScene(Scene):
         self.attack_button.update(dt)
         self.capture_button.update(dt)
         self.run_button.update(dt)
+        self._watch_changes()
 
         if self.turn_state == "player_attack_animation":
             self.timer -= dt
             if self.timer <= 0:
                 self.enemy_monster["hp"] -= 30
+                impact_effect(self.particles, self._monster_centers()[1])
                 if self.enemy_monster["hp"] <= 0:
                     self.enemy_monster["hp"] = 0
                     self.turn_state = "end_defeat"
@@ -177,11 +205,13 @@ class CaptureScene(Scene):
                 else:
                     self.turn_state = "enemy_attack_animation"
                     self.timer = 1.0
+                    self._enemy_attack_effect()
 
         elif self.turn_state == "enemy_attack_animation":
             self.timer -= dt
             if self.timer <= 0:
                 self.player_monster["hp"] -= 20
+                impact_effect(self.particles, self._monster_centers()[0], (200, 90, 255))
 
                 if self.player_monster["hp"] <= 0:
                     self.player_monster["hp"] = 0
@@ -202,6 +232,35 @@ class CaptureScene(Scene):
                     self.game_manager.bag.monsters[0]["hp"] = self.player_monster["hp"]
                 scene_manager.change_scene("game")
 
+        self.particles.update(dt)
+        particle_rect = self.particles.dirty_rect()
+        if particle_rect is not None:
+            self.mark_dirty(particle_rect)
+
+    def _monster_centers(self) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Screen centers of the player's and the wild monster, as draw() places them."""
+        player = self.player_sprite.get_rect(topleft=(150, GameSettings.SCREEN_HEIGHT // 2))
+        enemy = self.enemy_sprite.get_rect(topleft=(
+            GameSettings.SCREEN_WIDTH - 150 - self.enemy_sprite.get_width(),
+            GameSettings.SCREEN_HEIGHT // 2))
+        return player.center, enemy.center
+
+    def _enemy_attack_effect(self, delay: float = 0.0) -> None:
+        player, enemy = self._monster_centers()
+        attack_effect(self.particles, enemy, player, (170, 80, 255), delay)
+
+    def _watch_changes(self) -> None:
+        for name in ("attack", "capture", "run"):
+            button: Button = getattr(self, f"{name}_button")
+            self.watch(name, button.img_button, button.hitbox)
+
+        # Monsters, HP text, buttons and the status line live in the lower half
+        hp = (self.player_monster["hp"] if self.player_monster else None,
+              self.enemy_monster["hp"] if self.enemy_monster else None)
+        band = pg.Rect(0, GameSettings.SCREEN_HEIGHT // 2 - 40, GameSettings.SCREEN_WIDTH,
+                       GameSettings.SCREEN_HEIGHT // 2 + 40)
+        self.watch("capture", (self.turn_state, hp, self.capture_attempt_text), band)
+
     @override
     def draw(self, screen: pg.Surface) -> None:
         self.background.draw(screen)
@@ -209,7 +268,7 @@ class CaptureScene(Scene):
         self.capture_button.draw(screen)
         self.run_button.draw(screen)
 
-        font = pg.font.SysFont(None, 30)
+        font = resource_manager.get_sys_font(None, 30)
 
         # Player Monster
         player_pos = (150, GameSettings.SCREEN_HEIGHT // 2)
@@ -217,13 +276,13 @@ class CaptureScene(Scene):
         if self.player_monster["hp"] > 0:
             screen.blit(self.player_sprite, player_pos)
         else:
-            fainted_text = font.render("DEAD", True, (255, 0, 0))
+            fainted_text = resource_manager.render_text(font, "DEAD", (255, 0, 0))
             screen.blit(fainted_text, player_pos)
 
         # Player Monster HP
-        player_hp_text = font.render(
-            f'HP: {self.player_monster["hp"]}/{self.player_monster["max_hp"]} - LVL {self.player_monster["level"]}',
-            True, (255, 255, 255)
+        player_hp_text = resource_manager.render_text(
+            font, f'HP: {self.player_monster["hp"]}/{self.player_monster["max_hp"]} - LVL {self.player_monster["level"]}',
+            (255, 255, 255)
         )
         screen.blit(player_hp_text, (player_pos[0], player_pos[1] - 40))
 
@@ -234,17 +293,17 @@ class CaptureScene(Scene):
         if self.enemy_monster["hp"] > 0:
             screen.blit(self.enemy_sprite, enemy_pos)
         else:
-            fainted_text = font.render("DEAD", True, (255, 0, 0))
+            fainted_text = resource_manager.render_text(font, "DEAD", (255, 0, 0))
             screen.blit(fainted_text, enemy_pos)
 
-        enemy_hp_text = font.render(
-            f'HP: {self.enemy_monster["hp"]}/{self.enemy_monster["max_hp"]} - LVL {self.enemy_monster["level"]}',
-            True, (255, 255, 255)
+        enemy_hp_text = resource_manager.render_text(
+            font, f'HP: {self.enemy_monster["hp"]}/{self.enemy_monster["max_hp"]} - LVL {self.enemy_monster["level"]}',
+            (255, 255, 255)
         )
         screen.blit(enemy_hp_text, (enemy_pos[0] + 50, enemy_pos[1] - 40))
 
-        status_text = font.render(
-            self.capture_attempt_text, True, (255, 255, 255)
+        status_text = resource_manager.render_text(
+            font, self.capture_attempt_text, (255, 255, 255)
         )
 
         status_pos = (
@@ -252,3 +311,6 @@ class CaptureScene(Scene):
             GameSettings.SCREEN_HEIGHT - 50
         )
         screen.blit(status_text, status_pos)
+
+        # Attack, impact and capture effects on top of everything
+        self.particles.draw(screen)
@@ -1,13 +1,14 @@
 import pygame as pg
-import pytmx
 import random
 from collections import deque
 from src.scenes.scene import Scene
-from src.core.services import scene_manager, input_manager
+from src.core.services import scene_manager, input_manager, resource_manager, quality_manager, debug_draw
+from src.core.managers import DebugMode
+from src.core.render_backend import ReducedCanvas, WorldCanvas, reduced_canvas
 from src.entities.shop_npc import ShopNPC
 from src.entities.player import Player
 from src.core import GameManager, OnlineManager
-from src.utils import Logger, PositionCamera, GameSettings, Position
+from src.utils import Logger, GameSettings, Position, Camera
 from src.core.services import sound_manager
 from src.interface.components import (
     Button,
@@ -17,8 +18,9 @@ from src.interface.components import (
 )
 from src.interface.components.shop_item_list import ShopItemList
 from src.interface.components.shop_item_row import ShopItemRow
+from src.interface.components.network_stats_overlay import NetworkStatsOverlay
 from typing import override
-from src.sprites import Sprite, Animation
+from src.sprites import Sprite, Animation, RenderQueue
 
 
 class GameScene(Scene):
@@ -40,34 +42,9 @@ class GameScene(Scene):
             exit(1)
         self.game_manager = manager
 
-        # Load Map
-        self.tmx_data = pytmx.util_pygame.load_pygame(
-            "assets/maps/map.tmx")
-
-        # Bush Rects
-        self.bush_rects = []
-
         # Chat Overlay
         self._online_last_pos: dict[int, tuple[float, float]] = {}
 
-        # Get the bush layer
-        bush_layer = self.tmx_data.get_layer_by_name("PokemonBush")
-
-        for x, y, gid in bush_layer:
-            if gid <= 30:
-                continue  # Skip empty tiles
-            tile = self.tmx_data.get_tile_image_by_gid(gid)
-            if tile:
-
-                rect = pg.Rect(
-                    x * GameSettings.TILE_SIZE,
-                    y * GameSettings.TILE_SIZE,
-                    GameSettings.TILE_SIZE,
-                    GameSettings.TILE_SIZE
-                )
-
-                self.bush_rects.append(rect)
-
         # Setting Button
         self.settings_button = Button(
             "UI/button_setting.png", "UI/button_setting_hover.png",
@@ -121,9 +98,22 @@ class GameScene(Scene):
         else:
             self.online_manager = None
 
+        # Network statistics overlay (toggle with F3)
+        self.net_stats_overlay = NetworkStatsOverlay(
+            GameSettings.SCREEN_WIDTH - 250, 190)
+        self.net_stats_overlay.set_stats(
+            self.online_manager.stats if self.online_manager else None)
+
         self.sprite_online = Sprite(
             "ingame_ui/options1.png", (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE))
         self.remote_players: dict[int, dict] = {}
+        self.render_queue = RenderQueue()
+        self.camera = Camera(GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT)
+        # Lower quality levels draw the world here and upscale it
+        self._world_canvas: ReducedCanvas | None = None
+        # Minimap with markers, redrawn every quality_manager minimap_interval frames
+        self._minimap_frame: pg.Surface | None = None
+        self._minimap_age = 0
 
         # Overlay flag for Settings
         self.settings_overlay = False
@@ -137,6 +127,14 @@ class GameScene(Scene):
         # Overlay flag for ShopNPC
         self.shop_npc_overlay = False
 
+        # While a modal overlay is open the world is drawn once into this
+        # pre-dimmed snapshot, and only the panel is redrawn on top of it.
+        self._frozen_world: pg.Surface | None = None
+        self._dim_layer = pg.Surface(
+            (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
+        self._dim_layer.fill((0, 0, 0))
+        self._dim_layer.set_alpha(150)
+
         screen_w, screen_h = GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT
 
         # Settings overlay box
@@ -567,6 +565,7 @@ class GameScene(Scene):
     @override
     def enter(self) -> None:
         sound_manager.play_bgm("RBY 103 Pallet Town.ogg")
+        self._update_camera()
         if self.online_manager:
             self.online_manager.enter()
 
@@ -575,8 +574,21 @@ class GameScene(Scene):
         if self.online_manager:
             self.online_manager.exit()
 
+    @override
+    def close(self) -> None:
+        if self.online_manager:
+            self.online_manager.close()
+
     @override
     def update(self, dt: float):
+        # Where this tick starts, so draw() can interpolate towards where it ends
+        if self.game_manager.player:
+            self.game_manager.player.snapshot_position()
+        for enemy in self.game_manager.current_enemy_trainers:
+            enemy.snapshot_position()
+        for shop in self.game_manager.current_shop_npc:
+            shop.snapshot_position()
+
         self.shop_item_list.update(dt)
 
         # Update player and other data
@@ -585,9 +597,13 @@ class GameScene(Scene):
 
         for enemy in self.game_manager.current_enemy_trainers:
             enemy.update(dt)
+            self.game_manager.entity_moved(enemy)
+
+        self.game_manager.current_map.update(dt)
 
         for shop in self.game_manager.current_shop_npc:
             shop.update(dt)
+            self.game_manager.entity_moved(shop)
 
             if shop.detected and input_manager.key_pressed(pg.K_SPACE):
                 self.shop_overlay = False
@@ -596,6 +612,15 @@ class GameScene(Scene):
         # Update bag
         self.game_manager.bag.update(dt)
 
+        # Debug shapes: off / hitboxes / everything
+        if input_manager.key_pressed(pg.K_F2):
+            debug_draw.cycle()
+
+        # Network statistics overlay
+        if input_manager.key_pressed(pg.K_F3):
+            self.net_stats_overlay.toggle()
+        self.net_stats_overlay.update(dt)
+
         # Online manager update
         if self.game_manager.player and self.online_manager:
             player = self.game_manager.player
@@ -628,14 +653,15 @@ class GameScene(Scene):
         # Bush collision detection
         if self.game_manager.player is not None:
             player_rect = self.game_manager.player.rect  # Player must have rect
-            self.player_in_bush = any(player_rect.colliderect(bush)
-                                      for bush in self.bush_rects)
+            zone = self.game_manager.current_map.encounter_zone_at(player_rect)
+            self.player_in_bush = zone is not None
 
             if self.player_in_bush:
                 if input_manager.key_pressed(pg.K_z) and not self.battle_triggered:
                     self.battle_triggered = True
                     capture_scene = scene_manager._scenes["capture_scene"]
                     capture_scene.set_game_manager(self.game_manager)
+                    capture_scene.set_encounter_zone(zone)
                     scene_manager.change_scene("capture_scene")
             else:
                 self.battle_triggered = False
@@ -680,12 +706,20 @@ class GameScene(Scene):
         if not self.is_navigating:
             self.game_manager.try_switch_map()
 
+    def _update_camera(self, alpha: float = 1.0) -> None:
+        """Move the camera once per frame; everything drawn this frame reads it."""
+        self.camera.set_bounds(*self.game_manager.current_map.pixel_size)
+        if self.game_manager.player:
+            self.camera.follow(self.game_manager.player.render_rect(alpha))
+
     def _update_remote_players(self, dt: float) -> None:
         if not self.online_manager:
             return
 
         remote_list = self.online_manager.get_list_players()
         active_ids = set()
+        current_map = self.game_manager.current_map.path_name
+        view = self._remote_view_rect()
 
         for p in remote_list:
 
@@ -694,26 +728,46 @@ class GameScene(Scene):
                 continue
             active_ids.add(pid)
 
-            sprite_path = p.get("sprite", "character/ow1.png")
+            target_x = p.get("x", 0)
+            target_y = p.get("y", 0)
             info = self.remote_players.get(pid)
-            if info is None or info.get("sprite") != sprite_path:
-                anim = Animation(
-                    sprite_path,
-                    ["down", "left", "right", "up"],
-                    4,
-                    (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE),
-                    loop=0.5
-                )
-                self.remote_players[pid] = {"anim": anim,
-                                            "sprite": sprite_path,
-                                            "data": p}
-            else:
-                self.remote_players[pid]["data"] = p
 
-            anim: Animation = self.remote_players[pid]["anim"]
+            # Players on other maps are never drawn; forget their lerp
+            # state so they snap into place when they arrive on ours.
+            if p.get("map") != current_map:
+                self._online_last_pos.pop(pid, None)
+                if info is not None:
+                    info["data"] = p
+                    info["visible"] = False
+                continue
+
+            # Off-screen players only track their position, no lerp or animation
+            if not view.collidepoint(target_x, target_y):
+                self._online_last_pos[pid] = (target_x, target_y)
+                if info is not None:
+                    info["data"] = p
+                    info["visible"] = False
+                continue
+
+            sprite_path = p.get("sprite", "character/ow1.png")
+            if info is None or info.get("sprite") != sprite_path:
+                # Unseen sheets are decoded off-thread; wait for them
+                # instead of stalling the frame on disk and decoding.
+                # Meanwhile a player who changed sprite keeps moving in
+                # the old one; a new player shows up once theirs is ready.
+                if resource_manager.is_image_ready(sprite_path):
+                    info = {"anim": self._create_remote_animation(sprite_path),
+                            "sprite": sprite_path}
+                    self.remote_players[pid] = info
+                else:
+                    resource_manager.prefetch_image(sprite_path)
+                    if info is None:
+                        continue
+            info["data"] = p
+            info["visible"] = True
+
+            anim: Animation = info["anim"]
 
-            target_x = p.get("x", 0)
-            target_y = p.get("y", 0)
             last_x, last_y = self._online_last_pos.get(
                 pid, (target_x, target_y))
 
@@ -730,10 +784,6 @@ class GameScene(Scene):
             anim.switch(dir_name)
 
             # pos update
-            target_x = p.get("x", 0)
-            target_y = p.get("y", 0)
-            last_x, last_y = self._online_last_pos.get(
-                pid, (target_x, target_y))
             lerp_speed = 8.0
             new_x = last_x + (target_x - last_x) * lerp_speed * dt
             new_y = last_y + (target_y - last_y) * lerp_speed * dt
@@ -750,74 +800,115 @@ class GameScene(Scene):
                 del self.remote_players[pid]
                 self._online_last_pos.pop(pid, None)
 
-    @override
-    def draw(self, screen: pg.Surface):
-        if self.game_manager.player:
-            camera = self.game_manager.player.camera
-            self.game_manager.current_map.draw(screen, camera)
-            self.game_manager.player.draw(screen, camera)
+    def _remote_view_rect(self) -> pg.Rect:
+        """World-space rect of the camera view grown by the quality level's remote margin."""
+        return self.camera.visible_rect(quality_manager.remote_margin)
+
+    def _create_remote_animation(self, sprite_path: str) -> Animation:
+        """Per-player playback state over the frames shared through resource_manager."""
+        try:
+            return Animation(
+                sprite_path,
+                ["down", "left", "right", "up"],
+                4,
+                (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE),
+                loop=0.5
+            )
+        except Exception as e:
+            Logger.warning(f"Remote sprite {sprite_path} failed to load: {e}")
+            return Animation(
+                "character/ow1.png",
+                ["down", "left", "right", "up"],
+                4,
+                (GameSettings.TILE_SIZE, GameSettings.TILE_SIZE),
+                loop=0.5
+            )
 
+    def _draw_minimap(self, screen: pg.Surface) -> None:
+        """Blit the minimap, redrawing its markers every few frames at lower quality."""
+        size = (150, 150)
+        self._minimap_age += 1
+        if (self._minimap_frame is None or self._minimap_frame.get_size() != size
+                or self._minimap_age >= quality_manager.level.minimap_interval):
+            self._render_minimap(size)
+            self._minimap_age = 0
+        screen.blit(self._minimap_frame, (screen.get_width() - size[0] - 20, 20))
+
+    def _render_minimap(self, size: tuple[int, int]) -> None:
+        """Redraw _minimap_frame: the cached map image with this frame's markers on top."""
+        current_map = self.game_manager.current_map
+        base = current_map.get_minimap(size)
+        if self._minimap_frame is None or self._minimap_frame.get_size() != size:
+            self._minimap_frame = base.copy()
         else:
-            camera = PositionCamera(0, 0)
-            self.game_manager.current_map.draw(screen, camera)
+            self._minimap_frame.blit(base, (0, 0))
+        minimap = self._minimap_frame
+        minimap_x = minimap_y = 0
 
-        # Draw Enemy Trainer
-        for enemy in self.game_manager.current_enemy_trainers:
-            enemy.draw(screen, camera)
+        # world px → minimap px
+        scale_x = size[0] / (current_map.tmxdata.width * GameSettings.TILE_SIZE)
+        scale_y = size[1] / (current_map.tmxdata.height * GameSettings.TILE_SIZE)
 
-        # Draw NPC Trainer
-        for shop in self.game_manager.current_shop_npc:
-            shop.draw(screen, camera)
+        def marker(x: float, y: float, color: tuple[int, int, int], radius: int) -> None:
+            pg.draw.circle(minimap, color,
+                           (minimap_x + int(x * scale_x), minimap_y + int(y * scale_y)),
+                           radius)
 
-        # Draw Minimap
-        minimap_raw = self.game_manager.current_map.build_minimap()
-        if minimap_raw:
-            minimap_scaled = pg.transform.scale(minimap_raw, (150, 150))
-
-            map_w = self.game_manager.current_map.tmxdata.width
-            map_h = self.game_manager.current_map.tmxdata.height
+        # Every remote player on the map, not just those near the view
+        if self.online_manager:
+            for data in self.online_manager.get_list_players():
+                if data.get("map") == current_map.path_name:
+                    marker(data.get("x", 0), data.get("y", 0), (255, 255, 255), 2)
+        for enemy in self.game_manager.current_enemy_trainers:
+            marker(enemy.position.x, enemy.position.y, (255, 200, 0), 2)
+        for shop in self.game_manager.current_shop_npc:
+            marker(shop.position.x, shop.position.y, (0, 160, 255), 2)
 
-            # player
-            player = self.game_manager.player
-            px_tile = player.position.x // GameSettings.TILE_SIZE
-            py_tile = player.position.y // GameSettings.TILE_SIZE
+        player = self.game_manager.player
+        if player:
+            marker(player.position.x, player.position.y, (255, 0, 0), 3)
 
-            # scale tile coords → minimap coords
-            px = int(px_tile * (150 / map_w))
-            py = int(py_tile * (150 / map_h))
+    def _modal_open(self) -> bool:
+        return (self.settings_overlay or self.backpack_overlay
+                or self.shop_overlay or self.shop_npc_overlay)
 
-            # draw player dot
-            mm = minimap_scaled.copy()
-            pg.draw.circle(mm, (255, 0, 0), (px, py), 3)
+    @override
+    def draw(self, screen: pg.Surface):
+        self._update_camera(self.render_alpha)
+        if self._modal_open():
+            if self._frozen_world is None:
+                self._draw_world(screen)
+                self._frozen_world = screen.copy()
+                self._frozen_world.blit(self._dim_layer, (0, 0))
+            screen.blit(self._frozen_world, (0, 0))
+        else:
+            self._frozen_world = None
+            self._draw_world(screen)
+
+        self._draw_overlays(screen)
+
+        # Network statistics overlay stays on top of everything
+        self.net_stats_overlay.draw(screen)
+
+    def _draw_world(self, screen: pg.Surface) -> None:
+        """Map, entities and HUD: everything a modal overlay covers."""
+        level = quality_manager.level
+        if level.render_scale < 1 and not isinstance(screen, WorldCanvas):
+            # Reduced internal resolution for the world, HUD stays sharp
+            self._world_canvas = reduced_canvas(
+                screen, level.render_scale, level.smooth_scale, self._world_canvas)
+            self._world_canvas.fill((0, 0, 0))
+            self._draw_map_and_entities(self._world_canvas)
+            self._world_canvas.upscale_to(screen)
+        else:
+            self._draw_map_and_entities(screen)
+        self._draw_debug(screen)
 
-            # draw minimap
-            minimap_x = screen.get_width() - 150 - 20
-            minimap_y = 20
-            screen.blit(mm, (minimap_x, minimap_y))
+        # Draw Minimap
+        self._draw_minimap(screen)
 
         self.game_manager.bag.draw(screen)
 
-        if self.online_manager and self.game_manager.player:
-            cam = self.game_manager.player.camera
-            for pid, info in list(self.remote_players.items()):
-                data = info.get("data")
-                anim: Animation = info.get("anim")
-                if not data or not anim:
-                    continue
-                if data.get("map") != self.game_manager.current_map.path_name:
-                    continue
-                anim.draw(screen, cam)
-
-        if self.game_manager.player:
-            # Draw all bush rects in red
-            # for bush in self.bush_rects:
-            # rect_on_screen = camera.transform_rect(bush)
-            # pg.draw.rect(screen, (255, 0, 0), rect_on_screen, 2)
-
-            player_rect_on_screen = camera.transform_rect(
-                self.game_manager.player.rect)
-            pg.draw.rect(screen, (0, 255, 0), player_rect_on_screen, 2)
-
         # Settings Button
         self.settings_button.draw(screen)
 
@@ -832,25 +923,53 @@ class GameScene(Scene):
         self.place2_button.draw(screen)
         self.place3_button.draw(screen)
 
+    def _draw_map_and_entities(self, screen: pg.Surface) -> None:
+        player = self.game_manager.player
+        camera = self.camera
+        self.game_manager.current_map.draw(screen, camera)
+
+        # Characters go through the render queue: sorted by their feet so
+        # whoever stands lower on screen is drawn in front.
+        queue = self.render_queue
+        alpha = self.render_alpha
+        if player:
+            player.submit(queue, camera, alpha)
+
+        # Draw Enemy Trainers and NPCs near the view
+        for entity in self.game_manager.entities_in(camera.visible_rect(GameSettings.TILE_SIZE)):
+            entity.submit(queue, camera, alpha)
+
+        if self.online_manager and player:
+            for pid, info in list(self.remote_players.items()):
+                anim: Animation = info.get("anim")
+                if not anim or not info.get("visible"):
+                    continue
+                anim.submit(queue, camera)
+
+        if player:
+            debug_draw.rect((0, 255, 0), player.render_rect(alpha), 2)
+
         # Debug NAV PATH
-        if self.navigation_path:
+        if self.navigation_path and debug_draw.shows():
             for tile in self.navigation_path:
                 rect = pg.Rect(tile[0]*GameSettings.TILE_SIZE,
                                tile[1]*GameSettings.TILE_SIZE,
                                GameSettings.TILE_SIZE,
                                GameSettings.TILE_SIZE)
-                rect = camera.transform_rect(rect)
-                pg.draw.rect(screen, (0, 0, 255), rect, 2)
+                debug_draw.rect((0, 0, 255), rect, 2)
+
+        queue.flush(screen)
 
+    def _draw_debug(self, screen: pg.Surface) -> None:
+        """Debug shapes over the world, at full resolution even when the world is not."""
+        current_map = self.game_manager.current_map
+        debug_draw.static(f"collision:{current_map.path_name}", current_map.collision_debug_shapes)
+        debug_draw.static(f"encounters:{current_map.path_name}", current_map.encounter_debug_shapes)
+        debug_draw.flush(screen, self.camera)
+
+    def _draw_overlays(self, screen: pg.Surface) -> None:
         # Draw overlay if backpack is active
         if self.backpack_overlay:
-            # Darken background
-            overlay = pg.Surface(
-                (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(150)
-            screen.blit(overlay, (0, 0))
-
             # Draw middle overlay panel
             pg.draw.rect(screen, (50, 50, 50),
                          self.backpack_rect)
@@ -858,8 +977,8 @@ class GameScene(Scene):
                          self.backpack_rect, 3)  # border
 
             # Draw overlay text
-            font = pg.font.SysFont(None, 40)
-            text = font.render("Backpack", True, (255, 255, 255))
+            font = resource_manager.get_sys_font(None, 40)
+            text = resource_manager.render_text(font, "Backpack", (255, 255, 255))
             screen.blit(text, (self.backpack_rect.x + 30,
                         self.backpack_rect.y + 25))
 
@@ -871,12 +990,6 @@ class GameScene(Scene):
 
         # Draw Shop Overlay if active
         if self.shop_overlay:
-            overlay = pg.Surface(
-                (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(150)
-            screen.blit(overlay, (0, 0))
-
             # Draw middle overlay panel
             pg.draw.rect(screen, (50, 50, 50),
                          self.overlay_rect)
@@ -884,24 +997,18 @@ class GameScene(Scene):
                          3)  # border
 
             # Draw overlay text
-            font = pg.font.SysFont(None, 30)
-            text = font.render("Shop List", True, (255, 255, 255))
+            font = resource_manager.get_sys_font(None, 30)
+            text = resource_manager.render_text(font, "Shop List", (255, 255, 255))
             screen.blit(text, (self.overlay_rect.x +
                         100, self.overlay_rect.y + 50))
 
-            label_font = pg.font.SysFont(None, 24)
+            label_font = resource_manager.get_sys_font(None, 24)
 
             self.back_button_shop.draw(screen)
             self.shop_item_list.draw(screen)
 
         # Draw SHOPNPC overlay if active
         if self.shop_npc_overlay:
-            overlay = pg.Surface(
-                (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(150)
-            screen.blit(overlay, (0, 0))
-
             # Draw middle overlay panel
             pg.draw.rect(screen, (50, 50, 50),
                          self.overlay_rect)
@@ -909,12 +1016,12 @@ class GameScene(Scene):
                          3)  # border
 
             # Draw overlay text
-            font = pg.font.SysFont(None, 30)
-            text = font.render("Shop NPC List", True, (255, 255, 255))
+            font = resource_manager.get_sys_font(None, 30)
+            text = resource_manager.render_text(font, "Shop NPC List", (255, 255, 255))
             screen.blit(text, (self.overlay_rect.x +
                         100, self.overlay_rect.y + 50))
 
-            label_font = pg.font.SysFont(None, 24)
+            label_font = resource_manager.get_sys_font(None, 24)
 
             self.shop_npc_list.draw(screen)
             self.back_button_shop_npc.draw(screen)
@@ -922,12 +1029,6 @@ class GameScene(Scene):
 
         # Draw overlay if active
         if self.settings_overlay:
-            overlay = pg.Surface(
-                (GameSettings.SCREEN_WIDTH, GameSettings.SCREEN_HEIGHT))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(150)
-            screen.blit(overlay, (0, 0))
-
             # Draw middle overlay panel
             pg.draw.rect(screen, (50, 50, 50),
                          self.overlay_rect)
@@ -935,21 +1036,21 @@ class GameScene(Scene):
                          3)  # border
 
             # Draw overlay text
-            font = pg.font.SysFont(None, 30)
-            text = font.render("Settings Menu", True, (255, 255, 255))
+            font = resource_manager.get_sys_font(None, 30)
+            text = resource_manager.render_text(font, "Settings Menu", (255, 255, 255))
             screen.blit(text, (self.overlay_rect.x +
                         100, self.overlay_rect.y + 50))
 
-            label_font = pg.font.SysFont(None, 24)
+            label_font = resource_manager.get_sys_font(None, 24)
             # Draw volume label and percentage
-            label_font = pg.font.SysFont(None, 24)
-            volume_text = label_font.render("Volume", True, (255, 255, 255))
+            label_font = resource_manager.get_sys_font(None, 24)
+            volume_text = resource_manager.render_text(label_font, "Volume", (255, 255, 255))
             screen.blit(volume_text, (self.volume_slider.x,
                                       self.volume_slider.y - 30))
 
             volume_percent = int(GameSettings.AUDIO_VOLUME * 100)
-            percent_text = label_font.render(
-                f"{volume_percent}%", True, (255, 255, 255))
+            percent_text = resource_manager.render_text(
+                label_font, f"{volume_percent}%", (255, 255, 255))
             screen.blit(percent_text, (self.volume_slider.x +
                                        self.volume_slider.width - 50,
                                        self.volume_slider.y - 30))
@@ -958,7 +1059,7 @@ class GameScene(Scene):
             self.volume_slider.draw(screen)
 
             # Draw mute label
-            mute_text = label_font.render("Mute Audio", True, (255, 255, 255))
+            mute_text = resource_manager.render_text(label_font, "Mute Audio", (255, 255, 255))
             screen.blit(mute_text, (self.mute_checkbox.x +
                                     self.mute_checkbox.size + 10,
                                     self.mute_checkbox.y - 2))
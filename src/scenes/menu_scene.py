@@ -9,6 +9,7 @@ from typing import override
 
 
 class MenuScene(Scene):
+    tracks_dirty_rects = True
     # Background Image
     background: BackgroundSprite
     # Buttons
@@ -49,6 +50,9 @@ class MenuScene(Scene):
         self.play_button.update(dt)
         self.settings_button.update(dt)
 
+        self.watch("play", self.play_button.img_button, self.play_button.hitbox)
+        self.watch("settings", self.settings_button.img_button, self.settings_button.hitbox)
+
     @override
     def draw(self, screen: pg.Surface) -> None:
         self.background.draw(screen)
@@ -1,9 +1,21 @@
 from __future__ import annotations
 import pygame as pg
 
+_UNSEEN = object()
+
+
 class Scene:
+    # Scenes that set this report what changed through mark_dirty()/watch(),
+    # and the engine only redraws those regions. Other scenes redraw every frame.
+    tracks_dirty_rects: bool = False
+    _dirty: list[pg.Rect] | None    # None means the whole screen
+    _watched: dict[str, object]
+    # How far rendering is between the last two fixed updates (0..1)
+    render_alpha: float = 1.0
+
     def __init__(self) -> None:
-        ...
+        self._dirty = None
+        self._watched = {}
 
     def enter(self) -> None:
         ...
@@ -11,8 +23,32 @@ class Scene:
     def exit(self) -> None:
         ...
 
+    def close(self) -> None:
+        """Release what the scene holds for the whole session; called once at shutdown."""
+        ...
+
     def update(self, dt: float) -> None:
         ...
 
     def draw(self, screen: pg.Surface) -> None:
-        ...
\ No newline at end of file
+        ...
+
+    def mark_dirty(self, rect: pg.Rect | None = None) -> None:
+        """Schedule `rect` for redraw, or the whole screen when no rect is given."""
+        if rect is None:
+            self._dirty = None
+        elif self._dirty is not None:
+            self._dirty.append(pg.Rect(rect))
+
+    def watch(self, key: str, value: object, rect: pg.Rect) -> None:
+        """Mark `rect` dirty whenever `value` differs from the last value watched under `key`."""
+        if self._watched.get(key, _UNSEEN) != value:
+            self._watched[key] = value
+            self.mark_dirty(rect)
+
+    def dirty_rects(self) -> list[pg.Rect] | None:
+        """Regions changed since the last call; None asks for a full redraw."""
+        if not self.tracks_dirty_rects:
+            return None
+        rects, self._dirty = self._dirty, []
+        return rects
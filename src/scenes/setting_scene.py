@@ -8,6 +8,7 @@ from typing import override
 
 
 class SettingScene(Scene):
+    tracks_dirty_rects = True
     background: BackgroundSprite
     back_button: Button
 
@@ -54,6 +55,12 @@ class SettingScene(Scene):
         self.volume_slider.update(dt)
         self.mute_checkbox.update(dt)
 
+        slider = self.volume_slider
+        self.watch("back", self.back_button.img_button, self.back_button.hitbox)
+        self.watch("volume", (slider.slider_handle_x, slider.dragging, GameSettings.AUDIO_VOLUME),
+                   slider.bounds)
+        self.watch("mute", self.mute_checkbox.muted, self.mute_checkbox.checkbox_rect)
+
     @override
     def draw(self, screen: pg.Surface) -> None:
         self.background.draw(screen)
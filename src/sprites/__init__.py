@@ -1,3 +1,5 @@
 from .sprite import Sprite
 from .background import BackgroundSprite
-from .animation import Animation
\ No newline at end of file
+from .animation import Animation
+from .render_queue import RenderQueue, RenderLayer
+from .particles import ParticleSystem
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pygame as pg
 
 from .sprite import Sprite
+from .render_queue import RenderQueue, RenderLayer
+from src.core.services import resource_manager
 from src.utils import GameSettings, Logger, PositionCamera, Position
 from typing import Optional
 
@@ -22,23 +24,14 @@ class Animation(Sprite):
         loop: float = 1                     # loop in second
     ):
         super().__init__(image_path)
-        sheet_w, sheet_h = self.image.get_size()
-        frame_w = sheet_w // n_keyframes
-        frame_h = sheet_h // len(rows)
 
         if (len(rows) <= 0 or n_keyframes <= 0):
             Logger.error("Invalid number of rows")
 
-        self.animations = {}
-        for r, name in enumerate(rows):
-            anim: list[pg.Surface] = []
-            for c in range(n_keyframes):
-                frame = self.image.subsurface(pg.Rect(
-                    c * frame_w, r * frame_h,
-                    frame_w, frame_h
-                ))
-                anim.append(pg.transform.smoothscale(frame, size))
-            self.animations[name] = anim
+        # Frames are shared between every Animation on the same sheet;
+        # only the playback state below is per instance.
+        self.animations = resource_manager.get_animation_frames(
+            image_path, rows, n_keyframes, size)
 
         self.accumulator = 0
         self.cur_row = rows[0]
@@ -58,10 +51,21 @@ class Animation(Sprite):
     def update_pos(self, pos: Position):
         self.rect.topleft = (pos.x, pos.y)
 
-    def draw(self, screen: pg.Surface, camera: Optional[PositionCamera] = None):
+    @property
+    def frame(self) -> pg.Surface:
         frames = self.animations[self.cur_row]
         idx = int((self.accumulator / self.loop) * self.n_keyframes)
+        return frames[idx]
+
+    def draw(self, screen: pg.Surface, camera: Optional[PositionCamera] = None):
         if camera:
-            screen.blit(frames[idx], camera.transform_rect(self.rect))
+            screen.blit(self.frame, camera.transform_dest(self.rect))
         else:
-            screen.blit(frames[idx], self.rect)
+            screen.blit(self.frame, self.rect)
+
+    def submit(self, queue: RenderQueue, camera: Optional[PositionCamera] = None,
+               layer: RenderLayer = RenderLayer.ENTITIES, rect: pg.Rect | None = None) -> None:
+        """Queue the current frame at `rect` (defaults to self.rect)."""
+        rect = rect if rect is not None else self.rect
+        dest = camera.transform_dest(rect) if camera else rect
+        queue.submit(self.frame, dest, layer, rect.bottom)
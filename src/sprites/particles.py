@@ -0,0 +1,196 @@
+import numpy as np
+import pygame as pg
+
+MAX_PARTICLES = 8192    # Emits beyond this are dropped
+PARTICLE_SIZE = 3       # Edge length of a particle in pixels
+
+Color = tuple[int, int, int]
+
+# Pixel offsets of a particle's square
+_SQUARE_X, _SQUARE_Y = (offsets.ravel() for offsets in np.mgrid[:PARTICLE_SIZE, :PARTICLE_SIZE])
+
+
+class ParticleSystem:
+    """
+    Particles kept as NumPy arrays, one row per particle: no per-particle
+    Python objects. update() moves and ages all of them in a few vectorized
+    operations, draw() writes them straight into the screen's pixels.
+    Dead particles are compacted away, so rows [0, count) are always alive.
+    """
+    pos: np.ndarray     # (n, 2) float32 screen position
+    vel: np.ndarray     # (n, 2) float32 pixels per second
+    age: np.ndarray     # (n,) float32 seconds lived, negative while waiting to appear
+    life: np.ndarray    # (n,) float32 seconds to live
+    color: np.ndarray   # (n, 3) float32 RGB
+    gravity: np.ndarray  # (n,) float32 downward pixels per second squared
+    count: int
+
+    def __init__(self, capacity: int = MAX_PARTICLES):
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.age = np.zeros(capacity, np.float32)
+        self.life = np.ones(capacity, np.float32)
+        self.color = np.zeros((capacity, 3), np.float32)
+        self.gravity = np.zeros(capacity, np.float32)
+        self.count = 0
+        self._rng = np.random.default_rng()
+        self._last_bounds: pg.Rect | None = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def emit(
+        self, n: int, origin: tuple[float, float],
+        speed: tuple[float, float], life: tuple[float, float], color: Color,
+        direction: float = 0.0, spread: float = np.pi, radius: float = 0.0,
+        gravity: float = 0.0, color_jitter: int = 30, delay: float = 0.0
+    ) -> None:
+        """
+        Spawn `n` particles around `origin` (within `radius`), flying at
+        `direction` radians +- `spread` with a random speed and lifetime
+        from the given (min, max) ranges, appearing after `delay` seconds.
+        """
+        rng = self._rng
+        n = min(n, len(self.age) - self.count)
+        if n <= 0:
+            return
+        new = slice(self.count, self.count + n)
+
+        angle = rng.uniform(0.0, 2 * np.pi, n)
+        dist = radius * np.sqrt(rng.random(n))
+        self.pos[new, 0] = origin[0] + np.cos(angle) * dist
+        self.pos[new, 1] = origin[1] + np.sin(angle) * dist
+
+        heading = direction + rng.uniform(-spread, spread, n)
+        velocity = rng.uniform(speed[0], speed[1], n)
+        self.vel[new, 0] = np.cos(heading) * velocity
+        self.vel[new, 1] = np.sin(heading) * velocity
+
+        self.age[new] = -delay
+        self.life[new] = rng.uniform(life[0], life[1], n)
+        self.color[new] = np.clip(
+            np.asarray(color, np.float32) + rng.integers(-color_jitter, color_jitter + 1, (n, 3)),
+            0, 255)
+        self.gravity[new] = gravity
+        self.count += n
+
+    def update(self, dt: float) -> None:
+        n = self.count
+        if n == 0:
+            return
+        started = (self.age[:n] >= 0)[:, None]
+        self.vel[:n, 1] += self.gravity[:n] * dt * started[:, 0]
+        self.pos[:n] += self.vel[:n] * dt * started
+        self.age[:n] += dt
+
+        alive = self.age[:n] < self.life[:n]
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for array in (self.pos, self.vel, self.age, self.life, self.color, self.gravity):
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
+
+    def bounds(self) -> pg.Rect | None:
+        """Screen rect covering every live particle."""
+        if self.count == 0:
+            return None
+        pos = self.pos[:self.count]
+        left, top = np.floor(pos.min(axis=0)).astype(int)
+        right, bottom = np.ceil(pos.max(axis=0)).astype(int)
+        return pg.Rect(left, top, right - left + PARTICLE_SIZE, bottom - top + PARTICLE_SIZE)
+
+    def dirty_rect(self) -> pg.Rect | None:
+        """Where particles were at the last call and are now; None if there were none either time."""
+        bounds = self.bounds()
+        last, self._last_bounds = self._last_bounds, bounds
+        if bounds is None or last is None:
+            return bounds or last
+        return bounds.union(last)
+
+    def draw(self, screen: pg.Surface) -> None:
+        """Additively blend every particle into the screen, fading out over its life."""
+        n = self.count
+        if n == 0:
+            return
+        clip = screen.get_clip()
+        xy = self.pos[:n].astype(np.int32)
+        inside = ((self.age[:n] >= 0)
+                  & (xy[:, 0] >= clip.left) & (xy[:, 0] <= clip.right - PARTICLE_SIZE)
+                  & (xy[:, 1] >= clip.top) & (xy[:, 1] <= clip.bottom - PARTICLE_SIZE))
+        if not inside.any():
+            return
+        xs, ys = xy[inside, 0], xy[inside, 1]
+        fade = (1.0 - self.age[:n][inside] / self.life[:n][inside])[:, None]
+        glow = (self.color[:n][inside] * fade).astype(np.uint8)
+
+        if screen.get_bytesize() == 4:
+            _add_squares_32(screen, xs, ys, glow)
+        else:
+            _add_squares(screen, xs, ys, glow)
+
+
+def _add_squares_32(screen: pg.Surface, xs: np.ndarray, ys: np.ndarray, glow: np.ndarray) -> None:
+    """Saturating add of `glow` over each particle square, straight on the 32-bit pixel buffer."""
+    # glow in the surface's byte order; the fourth byte (alpha or padding) gets +0
+    add = np.zeros((len(xs), 1, 4), np.uint8)
+    add[:, 0, [shift // 8 for shift in screen.get_shifts()[:3]]] = glow
+    row = screen.get_pitch() // 4
+    index = (ys * row + xs)[:, None] + (_SQUARE_Y * row + _SQUARE_X)
+
+    buffer = screen.get_buffer()
+    pixels = np.frombuffer(buffer, np.uint32)
+    try:
+        lit = pixels[index].view(np.uint8).reshape(*index.shape, 4)
+        pixels[index] = (np.minimum(lit, 255 - add) + add).view(np.uint32)[..., 0]
+    finally:
+        del pixels, buffer  # Unlock the surface
+
+
+def _add_squares(screen: pg.Surface, xs: np.ndarray, ys: np.ndarray, glow: np.ndarray) -> None:
+    """Slower per-offset version for 24-bit and other surfaces."""
+    pixels = pg.surfarray.pixels3d(screen)
+    try:
+        for dx, dy in zip(_SQUARE_X, _SQUARE_Y):
+            px, py = xs + dx, ys + dy
+            pixels[px, py] = np.minimum(pixels[px, py].astype(np.uint16) + glow, 255)
+    finally:
+        del pixels  # Unlock the surface
+
+
+def attack_effect(particles: ParticleSystem, source: tuple[float, float],
+                  target: tuple[float, float], color: Color = (255, 140, 40),
+                  delay: float = 0.0) -> None:
+    """A spray of sparks from `source` that reaches `target` in about a second."""
+    dx, dy = target[0] - source[0], target[1] - source[1]
+    distance = float(np.hypot(dx, dy))
+    particles.emit(1500, source, (distance * 0.7, distance * 1.1), (0.6, 1.0), color,
+                   direction=float(np.arctan2(dy, dx)), spread=0.25, radius=20, delay=delay)
+
+
+def impact_effect(particles: ParticleSystem, at: tuple[float, float],
+                  color: Color = (255, 200, 80)) -> None:
+    """A radial burst that falls back down."""
+    particles.emit(800, at, (80, 360), (0.3, 0.8), color, radius=10, gravity=400)
+
+
+def heal_effect(particles: ParticleSystem, at: tuple[float, float]) -> None:
+    """Green motes drifting up around a monster."""
+    particles.emit(1000, at, (20, 80), (0.6, 1.2), (60, 220, 90),
+                   direction=-np.pi / 2, spread=0.6, radius=60, gravity=-120)
+
+
+def capture_effect(particles: ParticleSystem, at: tuple[float, float], success: bool) -> None:
+    """A ring collapsing onto the target, then a burst: gold when it held, white when it broke."""
+    ring = 160.0
+    # Launch inward from the ring so every particle arrives at the same time
+    for i in range(12):
+        angle = i * np.pi / 6
+        origin = (at[0] + np.cos(angle) * ring, at[1] + np.sin(angle) * ring)
+        particles.emit(100, origin, (ring * 1.6, ring * 1.8), (0.55, 0.6), (120, 160, 255),
+                       direction=angle + np.pi, spread=0.08, radius=8)
+    particles.emit(800, at, (60, 300), (0.5, 1.0),
+                   (255, 210, 60) if success else (230, 230, 230),
+                   radius=12, gravity=200, delay=0.55)
@@ -0,0 +1,33 @@
+import pygame as pg
+from enum import IntEnum
+
+from src.core.render_backend import blit_world
+
+
+class RenderLayer(IntEnum):
+    ENTITIES = 10   # Characters, depth sorted by their feet
+    EFFECTS = 20    # Things floating above characters (warning signs)
+
+
+class RenderQueue:
+    """
+    Collects one frame of world draw calls, sorts them once by
+    (layer, sort_y, submission order) and flushes them with a single blits().
+    """
+
+    def __init__(self) -> None:
+        self._items: list[tuple[int, float, int, pg.Surface, pg.Rect | tuple[int, int]]] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def submit(
+        self, surface: pg.Surface, dest: pg.Rect | tuple[int, int],
+        layer: RenderLayer = RenderLayer.ENTITIES, sort_y: float = 0.0
+    ) -> None:
+        self._items.append((layer, sort_y, len(self._items), surface, dest))
+
+    def flush(self, screen: pg.Surface) -> None:
+        self._items.sort(key=lambda item: item[:3])
+        blit_world(screen, [(item[3], item[4]) for item in self._items])
+        self._items.clear()
@@ -1,6 +1,7 @@
 import pygame as pg
 from src.core.services import resource_manager
-from src.utils import Position, PositionCamera
+from src.utils import Position, PositionCamera, optimize_surface
+from .render_queue import RenderQueue, RenderLayer
 from typing import Optional
 
 
@@ -12,7 +13,7 @@ class Sprite:
         self._path = img_path
         self.image = resource_manager.get_image(img_path)
         if size is not None:
-            self.image = pg.transform.scale(self.image, size)
+            self.image = optimize_surface(pg.transform.scale(self.image, size))
         self.rect = self.image.get_rect()
 
     @property
@@ -25,10 +26,15 @@ class Sprite:
 
     def draw(self, screen: pg.Surface, camera: Optional[PositionCamera] = None):
         if camera is not None:
-            screen.blit(self.image, camera.transform_rect(self.rect))
+            screen.blit(self.image, camera.transform_dest(self.rect))
         else:
             screen.blit(self.image, self.rect)
 
+    def submit(self, queue: RenderQueue, camera: Optional[PositionCamera] = None,
+               layer: RenderLayer = RenderLayer.ENTITIES) -> None:
+        dest = camera.transform_dest(self.rect) if camera is not None else self.rect
+        queue.submit(self.image, dest, layer, self.rect.bottom)
+
     def draw_hitbox(self, screen: pg.Surface, camera: Optional[PositionCamera] = None):
         if camera is not None:
             pg.draw.rect(screen, (255, 0, 0),
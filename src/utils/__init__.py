@@ -2,18 +2,28 @@
 
 from .logger import Logger
 from .settings import GameSettings
-from .loader import load_tmx, load_img, load_font, load_sound
+from .loader import load_tmx, load_img, decode_img, load_font, load_sound, to_display_format, optimize_surface, resample_surface
 from .definition import Position, PositionCamera, Direction, MouseBtn, Key, Teleport
+from .camera import Camera
+from .spatial_hash import SpatialHash
+from .alias_table import AliasTable
 
 __all__ = [
     "Logger",
     "GameSettings",
     "load_tmx",
     "load_img",
+    "decode_img",
+    "to_display_format",
+    "optimize_surface",
+    "resample_surface",
     "load_font",
     "load_sound",
     "Position",
     "PositionCamera",
+    "Camera",
+    "SpatialHash",
+    "AliasTable",
     "Direction",
     "MouseBtn",
     "Key",
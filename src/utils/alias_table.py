@@ -0,0 +1,47 @@
+import random
+from typing import Generic, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    """
+    Weighted random choice in O(1) per sample (Walker's alias method).
+    Building is O(n): every slot gets its own item with probability
+    `_keep[i]` and otherwise its alias, so a sample is one random slot
+    and one coin flip.
+    """
+    items: tuple[T, ...]
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if not items or len(items) != len(weights):
+            raise ValueError("AliasTable needs one weight per item and at least one item")
+        total = float(sum(weights))
+        if total <= 0 or min(weights) < 0:
+            raise ValueError("AliasTable weights must be non-negative with a positive sum")
+
+        n = len(items)
+        self.items = tuple(items)
+        self._keep = [w * n / total for w in weights]
+        self._alias = list(range(n))
+        small = [i for i, p in enumerate(self._keep) if p < 1.0]
+        large = [i for i, p in enumerate(self._keep) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            # Slot s is topped up from l
+            self._alias[s] = l
+            self._keep[l] -= 1.0 - self._keep[s]
+            (small if self._keep[l] < 1.0 else large).append(l)
+        # Whatever is left is 1.0 up to rounding
+        for i in small + large:
+            self._keep[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rng: random.Random | None = None) -> T:
+        rng = rng or random
+        slot = rng.randrange(len(self.items))
+        if rng.random() < self._keep[slot]:
+            return self.items[slot]
+        return self.items[self._alias[slot]]
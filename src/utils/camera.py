@@ -0,0 +1,59 @@
+from pygame import Rect
+from .definition import PositionCamera
+from .settings import GameSettings
+
+
+class Camera(PositionCamera):
+    """
+    Persistent camera owned by a scene. follow() it once per frame, then pass
+    it anywhere a PositionCamera is expected and use the queries to cull.
+    """
+    view: Rect                      # World-space rect currently on screen
+    bounds: tuple[int, int] | None  # Map size in pixels, None for unbounded
+
+    def __init__(self, view_w: int, view_h: int):
+        super().__init__(0, 0)
+        self.view = Rect(0, 0, view_w, view_h)
+        self.bounds = None
+
+    def set_bounds(self, width: int, height: int) -> None:
+        self.bounds = (width, height)
+
+    def follow(self, target: Rect) -> None:
+        """Center on `target`, keeping the view inside the map bounds."""
+        x = target.centerx - self.view.width // 2
+        y = target.centery - self.view.height // 2
+        if self.bounds is not None:
+            x = self._clamp(x, self.bounds[0], self.view.width)
+            y = self._clamp(y, self.bounds[1], self.view.height)
+        self.x, self.y = x, y
+        self.view.topleft = (x, y)
+
+    @staticmethod
+    def _clamp(value: int, world: int, view: int) -> int:
+        # A map smaller than the view is centered instead
+        if world <= view:
+            return (world - view) // 2
+        return max(0, min(value, world - view))
+
+    def is_visible(self, rect: Rect, margin: int = 0) -> bool:
+        if margin:
+            return self.view.inflate(margin * 2, margin * 2).colliderect(rect)
+        return self.view.colliderect(rect)
+
+    def visible_rect(self, margin: int = 0) -> Rect:
+        """World-space view grown by `margin` pixels on every side."""
+        return self.view.inflate(margin * 2, margin * 2)
+
+    def visible_tiles(self, margin: int = 0) -> tuple[int, int, int, int]:
+        """Inclusive (first_col, first_row, last_col, last_row) of tiles on screen."""
+        tile = GameSettings.TILE_SIZE
+        view = self.visible_rect(margin)
+        first_col = max(0, view.left // tile)
+        first_row = max(0, view.top // tile)
+        last_col = (view.right - 1) // tile
+        last_row = (view.bottom - 1) // tile
+        if self.bounds is not None:
+            last_col = min(last_col, -(-self.bounds[0] // tile) - 1)
+            last_row = min(last_row, -(-self.bounds[1] // tile) - 1)
+        return first_col, first_row, last_col, last_row
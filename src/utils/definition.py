@@ -40,7 +40,11 @@ class PositionCamera:
         return Position(int(position.x) - self.x, int(position.y) - self.y)
 
     def transform_rect(self, rect: Rect) -> Rect:
-        return Rect(rect.x - self.x, rect.y - self.y, rect.width, rect.height)
+        return rect.move(-self.x, -self.y)
+
+    def transform_dest(self, rect: Rect) -> tuple[int, int]:
+        """Screen position of `rect`'s top left: a blit destination without a new Rect."""
+        return (rect.x - self.x, rect.y - self.y)
 
 
 @dataclass
@@ -4,13 +4,75 @@ from pathlib import Path
 from .logger import Logger
 
 ASSETS_DIR = Path("assets")
+COLORKEY = (255, 0, 255)
 
-def load_img(path: str) -> pg.Surface:
+def decode_img(path: str) -> pg.Surface:
+    """Decode an image file without converting it, safe to call off the main thread."""
     Logger.info(f"Loading image: {path}")
     img = pg.image.load(str(ASSETS_DIR / "images" / path))
     if not img:
         Logger.error(f"Failed to load image: {path}")
-    return img.convert_alpha()
+    return img
+
+def load_img(path: str) -> pg.Surface:
+    return to_display_format(decode_img(path))
+
+def _alpha_counts(surface: pg.Surface) -> tuple[int, int]:
+    """Number of (visible, fully opaque) pixels of a per-pixel alpha surface."""
+    visible = pg.mask.from_surface(surface, 0).count()
+    opaque = pg.mask.from_surface(surface, 254).count()
+    return visible, opaque
+
+def to_display_format(surface: pg.Surface) -> pg.Surface:
+    """
+    Convert to the display pixel format, dropping the alpha channel when every
+    pixel is opaque. Safe for images that are still going to be resampled.
+    """
+    if pg.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pg.SRCALPHA:
+        w, h = surface.get_size()
+        _, opaque = _alpha_counts(surface)
+        if opaque == w * h:
+            return surface.convert()
+        return surface.convert_alpha()
+    return surface.convert()
+
+def optimize_surface(surface: pg.Surface) -> pg.Surface:
+    """
+    Pick the fastest format for a surface that will only be blitted from now on:
+    opaque -> display format, on/off transparency -> colorkey with RLE,
+    anything else -> per-pixel alpha.
+    Do not resample the result (colorkey edges would bleed).
+    """
+    if pg.display.get_surface() is None:
+        return surface
+    if not surface.get_flags() & pg.SRCALPHA:
+        return surface.convert()
+
+    w, h = surface.get_size()
+    visible, opaque = _alpha_counts(surface)
+    if opaque == w * h:
+        return surface.convert()
+    if visible != opaque:
+        return surface.convert_alpha()
+
+    keyed = pg.Surface((w, h))
+    keyed.fill(COLORKEY)
+    keyed.blit(surface, (0, 0))
+    keyed = keyed.convert()
+    keyed.set_colorkey(COLORKEY, pg.RLEACCEL)
+    # An opaque pixel that happens to be the key color would turn invisible
+    if pg.mask.from_surface(keyed).count() != opaque:
+        return surface.convert_alpha()
+    return keyed
+
+def resample_surface(surface: pg.Surface, size: tuple[int, int], smooth: bool = True) -> pg.Surface:
+    """Resize a surface made by optimize_surface(), going back to per-pixel alpha first."""
+    if surface.get_colorkey() is not None:
+        surface = surface.convert_alpha()
+    resize = pg.transform.smoothscale if smooth else pg.transform.scale
+    return optimize_surface(resize(surface, size))
 
 def load_sound(path: str) -> pg.mixer.Sound:
     Logger.info(f"Loading sound: {path}")
@@ -6,17 +6,31 @@ class Settings:
     # Screen
     SCREEN_WIDTH: int = 1280    # Width of the game window
     SCREEN_HEIGHT: int = 720    # Height of the game window
-    FPS: int = 60               # Frames per second
+    FPS: int = 60               # Render frames per second (cap)
+    SIM_RATE: int = 60          # Simulation ticks per second (fixed timestep)
+    MAX_SIM_STEPS: int = 5      # Ticks a single frame may catch up before time is dropped
+    BACKGROUND_FPS: int = 10    # Frames and ticks per second while minimized or unfocused
+    BACKGROUND_THROTTLE: bool = True  # Drop to BACKGROUND_FPS in the background
     TITLE: str = "I2P Final"    # Title of the game window
     DEBUG: bool = True          # Debug mode
+    HEADLESS: bool = False      # No window and no audio (SDL dummy drivers)
+    RENDER_BACKEND: str = "surface"  # "surface", "texture" (pygame._sdl2 renderer) or "threaded" (render thread)
     TILE_SIZE: int = 64         # Size of each tile in pixels
     DRAW_HITBOXES: bool = True  # Draw hitboxes for debugging
+    DIRTY_RECTS: bool = True    # Only redraw changed regions in scenes that support it
+    ADAPTIVE_QUALITY: bool = True  # Lower quality levels while frames run over budget
+    TARGET_FRAME_MS: float | None = None  # Frame budget for it (None: 1000 / FPS)
+    # Input
+    INPUT_RECORD_PATH: str | None = None  # Save the session's input as a replayable script
     # Audio
     MAX_CHANNELS: int = 16
     AUDIO_VOLUME: float = 0.5   # Volume of audio
     # Online
     IS_ONLINE: bool = False
     ONLINE_SERVER_URL: str = "http://127.0.0.1:8989"
+    ONLINE_RECORD_PATH: str | None = None  # Record every server response to this file
+    ONLINE_REPLAY_PATH: str | None = None  # Replay a recording instead of using the server
+    REMOTE_PLAYER_MARGIN: int = 128  # Pixels beyond the view where remote players still animate
 
 
 GameSettings = Settings()
@@ -0,0 +1,93 @@
+from pygame import Rect
+from typing import Callable, Generic, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+class SpatialHash(Generic[T]):
+    """
+    Buckets items by the grid cells their rect touches, so rect queries only
+    look at items in nearby cells. Rects are read live through `rect_of`:
+    call move() after an item moves (a no-op while it stays in its cells).
+    """
+    cell_size: int
+
+    def __init__(self, cell_size: int, rect_of: Callable[[T], Rect], items: Iterable[T] = ()):
+        self.cell_size = cell_size
+        self._rect_of = rect_of
+        self._cells: dict[tuple[int, int], list[T]] = {}
+        self._item_cells: dict[T, tuple[int, int, int, int]] = {}
+        self._order: dict[T, int] = {}     # Insertion number, for a stable query order
+        self._inserted = 0
+        for item in items:
+            self.insert(item)
+
+    def __len__(self) -> int:
+        return len(self._item_cells)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._item_cells
+
+    def insert(self, item: T) -> None:
+        if item in self._item_cells:
+            self.move(item)
+            return
+        self._order[item] = self._inserted
+        self._inserted += 1
+        span = self._span(self._rect_of(item))
+        self._item_cells[item] = span
+        for cell in self._cells_in(span):
+            self._cells.setdefault(cell, []).append(item)
+
+    def remove(self, item: T) -> None:
+        self._order.pop(item, None)
+        self._unlink(item)
+
+    def move(self, item: T) -> None:
+        if item not in self._item_cells:
+            self.insert(item)
+            return
+        span = self._span(self._rect_of(item))
+        if self._item_cells[item] != span:
+            self._unlink(item)
+            self._item_cells[item] = span
+            for cell in self._cells_in(span):
+                self._cells.setdefault(cell, []).append(item)
+
+    def _unlink(self, item: T) -> None:
+        span = self._item_cells.pop(item, None)
+        if span is None:
+            return
+        for cell in self._cells_in(span):
+            bucket = self._cells[cell]
+            bucket.remove(item)
+            if not bucket:
+                del self._cells[cell]
+
+    def query(self, rect: Rect) -> list[T]:
+        """Items whose rect overlaps `rect`, in the order they were inserted."""
+        found: set[T] = set()
+        rect_of = self._rect_of
+        for cell in self._cells_in(self._span(rect)):
+            for item in self._cells.get(cell, ()):
+                if item not in found and rect.colliderect(rect_of(item)):
+                    found.add(item)
+        return sorted(found, key=self._order.__getitem__)
+
+    def any_collides(self, rect: Rect) -> bool:
+        rect_of = self._rect_of
+        for cell in self._cells_in(self._span(rect)):
+            for item in self._cells.get(cell, ()):
+                if rect.colliderect(rect_of(item)):
+                    return True
+        return False
+
+    def _span(self, rect: Rect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    @staticmethod
+    def _cells_in(span: tuple[int, int, int, int]) -> Iterable[tuple[int, int]]:
+        first_x, first_y, last_x, last_y = span
+        return [(x, y) for y in range(first_y, last_y + 1) for x in range(first_x, last_x + 1)]